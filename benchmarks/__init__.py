@@ -0,0 +1,4 @@
+"""Micro-benchmarks for the per-frame subsystems.
+
+Run with ``python -m benchmarks.run``; see benchmarks/run.py for options.
+"""
@@ -0,0 +1,80 @@
+"""Benchmarks for drawing entities and the HUD."""
+import random
+
+import pygame
+
+from src.constants import ELITE_TYPES, SCREEN_HEIGHT, SCREEN_WIDTH
+from src.ui.hud import HUD
+from src.ui.render_queue import RenderQueue
+
+from benchmarks.fixtures import make_asteroids, make_simulation
+from benchmarks.harness import benchmark
+
+
+def _draw_setup(elite_type):
+    def setup(count):
+        _, asteroids = make_asteroids(count, elite_type)
+        # Spread the animations out so every pulse and shield frame shows up
+        rng = random.Random(count)
+        for asteroid in asteroids:
+            if elite_type is not None:
+                asteroid.time_alive = rng.uniform(0, 10)
+            if elite_type == "shielded":
+                asteroid.shield_angle = rng.uniform(0, 360)
+        return pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)), asteroids
+    return setup
+
+
+def _draw_all(state):
+    screen, asteroids = state
+    for asteroid in asteroids:
+        asteroid.draw(screen, 0.5)
+
+
+benchmark("draw.asteroid", setup=_draw_setup(None))(_draw_all)
+for _elite_type in ELITE_TYPES:
+    benchmark(f"draw.{_elite_type}", setup=_draw_setup(_elite_type))(_draw_all)
+
+
+def _hud_setup(count):
+    simulation = make_simulation()
+    player = simulation.player
+    # Every modifier line and a full perk list on screen
+    for perk in simulation.perk_manager.available_perks:
+        player.add_perk(perk)
+    simulation.credits = 123456
+    simulation.wave = 42
+    return pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)), HUD(), simulation
+
+
+@benchmark("draw.hud", setup=_hud_setup, counts=(1,))
+def hud(state):
+    screen, hud, simulation = state
+    # Count up so every call has a changed value to re-render
+    simulation.credits += 1
+    hud.draw(screen, simulation)
+
+
+@benchmark("draw.hud_steady", setup=_hud_setup, counts=(1,))
+def hud_steady(state):
+    screen, hud, simulation = state
+    hud.draw(screen, simulation)
+
+
+def _frame_setup(count):
+    simulation = make_simulation(asteroids=count, shots=max(10, count // 10))
+    return pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)), RenderQueue(), simulation
+
+
+@benchmark("render.immediate", setup=_frame_setup)
+def render_immediate(state):
+    screen, _, simulation = state
+    for drawable in simulation.drawables:
+        drawable.draw(screen, 0.5)
+
+
+@benchmark("render.queue", setup=_frame_setup)
+def render_queue(state):
+    screen, queue, simulation = state
+    queue.collect(simulation.drawables, 0.5, simulation.stores)
+    queue.flush(screen)
@@ -0,0 +1,189 @@
+"""Benchmarks for the per-tick game logic."""
+import random
+
+from src.constants import (
+    ASTEROID_KINDS,
+    ASTEROID_MIN_RADIUS,
+    ELITE_MIN_WAVE,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    SIMULATION_RATE,
+)
+from src.entities.elite_asteroid import create_elite_asteroid
+from src.entities.shot import Shot
+from src.game import GameSimulation
+
+from benchmarks.fixtures import FIXTURE_SEED, make_asteroids, make_simulation
+from benchmarks.harness import benchmark
+
+DT = 1 / SIMULATION_RATE
+
+
+def _with_shots(count):
+    return make_simulation(asteroids=count, shots=max(10, count // 10))
+
+
+@benchmark("simulation.update", setup=make_simulation)
+def update(simulation):
+    # Component stores plus updateables, i.e. everything moved in a tick
+    simulation.update_entities(DT)
+
+
+def _ticking(stores):
+    def setup(count):
+        simulation = make_simulation(asteroids=count, shots=max(4, count // 10))
+        simulation.use_stores(stores)
+        return simulation
+    return setup
+
+
+def _tick(simulation):
+    # A playing tick's steady work; step() would also switch stores and
+    # resolve the hits, which uses up the state
+    simulation.update_entities(DT)
+    simulation.collision_manager.check(simulation.player)
+
+
+# Where the stores start paying off; STORE_MIN_ENTITIES comes from these
+STORE_COUNTS = (10, 25, 50, 100, 200)
+benchmark("simulation.tick_plain", setup=_ticking(False), counts=STORE_COUNTS)(_tick)
+benchmark("simulation.tick_stores", setup=_ticking(True), counts=STORE_COUNTS)(_tick)
+
+
+def _step_asteroids(simulation):
+    if simulation.asteroid_store is not None:
+        simulation.asteroid_store.update(DT)
+    else:
+        simulation.updateables.update(DT)
+
+
+@benchmark("asteroids.update", setup=lambda count: make_simulation(count, elite_share=0))
+def asteroids_update(simulation):
+    _step_asteroids(simulation)
+
+
+@benchmark("elites.update", setup=lambda count: make_simulation(count, elite_share=1))
+def elites_update(simulation):
+    # Same as asteroids.update with every asteroid an elite; the batched
+    # behaviours should keep the two close
+    _step_asteroids(simulation)
+
+
+@benchmark("neighbors.refresh", setup=make_simulation)
+def neighbors_refresh(simulation):
+    # Positions are unchanged between runs, so this is the steady-state cost
+    simulation.neighbor_index.refresh(simulation.asteroids, simulation.asteroid_store)
+
+
+def _indexed(count):
+    simulation = make_simulation(count)
+    simulation.neighbor_index.refresh(simulation.asteroids, simulation.asteroid_store)
+    return simulation
+
+
+@benchmark("swarm.update", setup=_indexed)
+def swarm_update(simulation):
+    simulation.swarm_manager.update(DT)
+
+
+@benchmark("shots.churn", setup=lambda count: (make_simulation(), count), fresh=True)
+def shots_churn(state):
+    # Entity creation and destruction through the shot pool and store
+    simulation, count = state
+    shots = [Shot.acquire(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2) for _ in range(count)]
+    for shot in shots:
+        shot.kill()
+    if simulation.pool_manager is not None:
+        simulation.pool_manager.recycle()
+
+
+@benchmark("collisions.check", setup=_with_shots)
+def collision_check(simulation):
+    simulation.collision_manager.check(simulation.player)
+
+
+@benchmark("collisions.pass", setup=_with_shots, fresh=True)
+def collision_pass(simulation):
+    simulation.handle_collisions()
+
+
+@benchmark("collisions.elites", setup=lambda count: make_simulation(
+    asteroids=count, shots=max(10, count // 2), elite_share=1), fresh=True)
+def collision_elites(simulation):
+    # Dense fire into shields and exploders, which the plain pass rarely meets
+    simulation.handle_collisions()
+
+
+def _split_all(state):
+    _, pending = state
+    while pending:
+        pending.extend(pending.pop().split())
+
+
+@benchmark("split.asteroid", setup=make_asteroids, fresh=True)
+def split_asteroid(state):
+    _split_all(state)
+
+
+@benchmark("split.exploder", setup=lambda count: make_asteroids(count, "exploder"), fresh=True)
+def split_exploder(state):
+    _split_all(state)
+
+
+def _primed_exploders(count):
+    # count primed exploders among four times as many plain asteroids
+    simulation = make_simulation(asteroids=count * 4, elite_share=0)
+    rng = random.Random(FIXTURE_SEED)
+    exploders = []
+    for _ in range(count):
+        exploder = create_elite_asteroid(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT),
+                                         ASTEROID_MIN_RADIUS * 2, "exploder")
+        exploder.explosion_primed = True
+        exploder.health = 1
+        exploders.append(exploder)
+    simulation.neighbor_index.refresh(simulation.asteroids, simulation.asteroid_store)
+    return simulation, exploders
+
+
+@benchmark("explosions.chain", setup=_primed_exploders, counts=(10, 50, 100, 500), fresh=True)
+def explosion_chain(state):
+    # One detonation that sets off whatever it reaches, then the splits
+    simulation, exploders = state
+    exploders[0].kill()
+    with simulation.spawn_batch():
+        simulation.detonate(exploders[:1])
+
+
+@benchmark("explosions.resolve", setup=_primed_exploders, counts=(10, 50, 100, 500), fresh=True)
+def explosion_resolve(state):
+    # The same cascade without the splits: blast lookups and damage only
+    simulation, exploders = state
+    exploders[0].kill()
+    simulation.explosion_manager.resolve(exploders[:1])
+
+
+def _empty_game(count):
+    simulation = GameSimulation(seed=FIXTURE_SEED, verbose=False)
+    # Pick the wave that spawns about count asteroids
+    return simulation, max(ELITE_MIN_WAVE, count // ASTEROID_KINDS)
+
+
+@benchmark("simulation.spawn_wave", setup=_empty_game, fresh=True)
+def spawn_wave(state):
+    simulation, wave = state
+    simulation.spawn_wave(wave)
+
+
+def _wave_starting(count):
+    simulation, wave = _empty_game(count)
+    # A fresh game is in its first countdown; plan a bigger wave instead
+    simulation.wave = wave
+    simulation.plan_wave(wave)
+    simulation.countdown = DT / 2
+    return simulation
+
+
+@benchmark("simulation.wave_start", setup=_wave_starting, fresh=True)
+def wave_start(simulation):
+    # The tick the countdown runs out; the planned wave streams in from here
+    simulation.step(DT)
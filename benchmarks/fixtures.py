@@ -0,0 +1,89 @@
+"""Deterministic game states for the benchmarks to run on."""
+import random
+
+import pygame
+
+from src.constants import (
+    ASTEROID_KINDS,
+    ASTEROID_MIN_RADIUS,
+    ELITE_SPAWN_CHANCE,
+    ELITE_TYPES,
+    PLAYER_SHOOT_SPEED,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    STATE_PLAYING,
+)
+from src.entities.asteroid import Asteroid
+from src.entities.elite_asteroid import create_elite_asteroid
+from src.entities.shot import Shot
+from src.game import GameSimulation
+
+FIXTURE_SEED = 1234
+
+
+def make_simulation(asteroids=0, shots=0, elite_share=ELITE_SPAWN_CHANCE, seed=FIXTURE_SEED):
+    """Create a quiet game mid-wave with a given number of entities.
+
+    Asteroids get random positions, sizes and velocities, and about
+    elite_share of them are elites of a random type. The player cannot
+    die, so collision benchmarks never end the game.
+
+    Args:
+        asteroids: Number of asteroids to spawn
+        shots: Number of shots to spawn
+        elite_share: Fraction of asteroids that are elites
+        seed: Seed for both the game and the fixture layout
+
+    Returns:
+        GameSimulation: Game in the playing state
+    """
+    simulation = GameSimulation(seed=seed, verbose=False)
+    simulation.state = STATE_PLAYING
+    simulation.player.hp = simulation.player.max_hp = 10 ** 9
+
+    rng = random.Random(seed)
+    for _ in range(asteroids):
+        x = rng.uniform(0, SCREEN_WIDTH)
+        y = rng.uniform(0, SCREEN_HEIGHT)
+        radius = ASTEROID_MIN_RADIUS * rng.randint(1, ASTEROID_KINDS)
+        if rng.random() < elite_share:
+            asteroid = create_elite_asteroid(x, y, radius, rng.choice(ELITE_TYPES))
+        else:
+            asteroid = Asteroid.acquire(x, y, radius)
+        asteroid.velocity = pygame.Vector2(rng.uniform(40, 100), 0).rotate(rng.uniform(0, 360))
+
+    for _ in range(shots):
+        shot = Shot.acquire(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT))
+        shot.velocity = pygame.Vector2(0, PLAYER_SHOOT_SPEED).rotate(rng.uniform(0, 360))
+
+    # As at the start of a tick: stores on if there are enough entities,
+    # and the index refreshed so collisions and blasts can use it
+    simulation.balance_stores()
+    simulation.neighbor_index.refresh(simulation.asteroids, simulation.asteroid_store)
+    return simulation
+
+
+def make_asteroids(count, elite_type=None, radius=ASTEROID_MIN_RADIUS * ASTEROID_KINDS):
+    """Create a game holding count identical asteroids, for split and draw runs.
+
+    Args:
+        count: Number of asteroids
+        elite_type: Key from ELITE_TYPES, or None for plain asteroids
+        radius: Radius of every asteroid
+
+    Returns:
+        tuple: (GameSimulation, list of the asteroids)
+    """
+    simulation = make_simulation()
+    rng = random.Random(FIXTURE_SEED)
+    asteroids = []
+    for _ in range(count):
+        x = rng.uniform(0, SCREEN_WIDTH)
+        y = rng.uniform(0, SCREEN_HEIGHT)
+        if elite_type is None:
+            asteroid = Asteroid.acquire(x, y, radius)
+        else:
+            asteroid = create_elite_asteroid(x, y, radius, elite_type)
+        asteroid.velocity = pygame.Vector2(rng.uniform(40, 100), 0).rotate(rng.uniform(0, 360))
+        asteroids.append(asteroid)
+    return simulation, asteroids
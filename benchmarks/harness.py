@@ -0,0 +1,142 @@
+"""Registry, timing loop and baseline comparison for the benchmarks."""
+import statistics
+import time
+
+# Asteroid counts every scalable benchmark is run at
+ENTITY_COUNTS = (10, 100, 1000, 5000)
+
+BENCHMARKS = []
+
+
+class Benchmark:
+    """One registered benchmark function and the counts it runs at."""
+
+    def __init__(self, name, func, setup, counts, fresh):
+        self.name = name
+        self.func = func
+        self.setup = setup
+        self.counts = counts
+        self.fresh = fresh
+
+    def key(self, count):
+        return f"{self.name}[{count}]"
+
+
+def benchmark(name, setup, counts=ENTITY_COUNTS, fresh=False):
+    """Register a benchmark.
+
+    Args:
+        name: Dotted benchmark name, e.g. "simulation.update"
+        setup: Callable taking an entity count and returning the state the
+            benchmark runs on; never timed
+        counts: Entity counts to run at
+        fresh: Call setup again before every timed call, for benchmarks
+            that use up their state (splitting, collision resolution)
+    """
+    def register(func):
+        BENCHMARKS.append(Benchmark(name, func, setup, counts, fresh))
+        return func
+    return register
+
+
+def time_benchmark(bench, count, samples=5, min_time=0.05):
+    """Time one benchmark at one entity count.
+
+    Reusable state is timed in batches of calls long enough to measure,
+    calibrated so each sample takes at least min_time. Fresh-state
+    benchmarks time single calls, with setup outside the timed region.
+
+    Returns:
+        dict: Per-call seconds (min, median, mean, stdev) and call counts
+    """
+    timings = []
+    if bench.fresh:
+        number = 1
+        for _ in range(samples):
+            state = bench.setup(count)
+            start = time.perf_counter()
+            bench.func(state)
+            timings.append(time.perf_counter() - start)
+    else:
+        state = bench.setup(count)
+        number = _calibrate(bench.func, state, min_time)
+        for _ in range(samples):
+            start = time.perf_counter()
+            for _ in range(number):
+                bench.func(state)
+            timings.append((time.perf_counter() - start) / number)
+
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "samples": samples,
+        "number": number,
+    }
+
+
+def run_benchmarks(selected=None, samples=5, min_time=0.05, counts=None, report=None):
+    """Run the registered benchmarks.
+
+    Args:
+        selected: Substrings; only benchmarks whose name contains one run
+        samples: Timed samples per benchmark and count
+        min_time: Minimum seconds per sample for reusable-state benchmarks
+        counts: Override the entity counts of scalable benchmarks
+        report: Optional callable(key, result) called as results come in
+
+    Returns:
+        dict: Results keyed by "name[count]"
+    """
+    results = {}
+    for bench in BENCHMARKS:
+        if selected and not any(pattern in bench.name for pattern in selected):
+            continue
+        bench_counts = bench.counts
+        if counts is not None and bench.counts == ENTITY_COUNTS:
+            bench_counts = counts
+        for count in bench_counts:
+            key = bench.key(count)
+            results[key] = time_benchmark(bench, count, samples, min_time)
+            if report is not None:
+                report(key, results[key])
+    return results
+
+
+def compare(results, baseline, threshold=0.25):
+    """Find benchmarks that got slower than a baseline.
+
+    The fastest sample is compared, as it is the least affected by noise
+    from the rest of the machine.
+
+    Args:
+        results: Current results from run_benchmarks
+        baseline: Earlier results in the same format
+        threshold: Allowed slowdown as a fraction, 0.25 for 25%
+
+    Returns:
+        list: (key, baseline seconds, current seconds, ratio) for every
+            regression, worst first
+    """
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        before = baseline[key]["min"]
+        after = result["min"]
+        if before > 0 and after > before * (1 + threshold):
+            regressions.append((key, before, after, after / before))
+    regressions.sort(key=lambda regression: regression[3], reverse=True)
+    return regressions
+
+
+def _calibrate(func, state, min_time):
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func(state)
+        if time.perf_counter() - start >= min_time or number >= 1 << 20:
+            return number
+        number *= 2
@@ -0,0 +1,91 @@
+"""Run the benchmarks and optionally check them against a baseline.
+
+Usage:
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --save-baseline
+    python -m benchmarks.run --compare benchmarks/baseline.json --threshold 0.25
+
+Exits with status 1 when a comparison finds a regression.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+
+# Benchmarks draw to off-screen surfaces; never open a real window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from benchmarks import bench_rendering, bench_simulation  # noqa: E402,F401
+from benchmarks.harness import compare, run_benchmarks  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def save_results(path, results):
+    document = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the per-frame subsystems.")
+    parser.add_argument("--select", action="append", metavar="NAME",
+                        help="only run benchmarks whose name contains NAME (repeatable)")
+    parser.add_argument("--counts", type=int, nargs="+", default=None,
+                        help="entity counts to run scalable benchmarks at")
+    parser.add_argument("--samples", type=int, default=5,
+                        help="timed samples per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="minimum seconds per sample")
+    parser.add_argument("--output", metavar="PATH", default=None,
+                        help="write results as JSON")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help=f"write results to {DEFAULT_BASELINE}")
+    parser.add_argument("--compare", metavar="PATH", nargs="?", const=DEFAULT_BASELINE, default=None,
+                        help="compare against a baseline (default: the saved baseline)")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="slowdown that counts as a regression (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    pygame.init()
+
+    def report(key, result):
+        print(f"{key:32} {result['min'] * 1e3:10.3f} ms  (median {result['median'] * 1e3:.3f} ms)",
+              file=sys.stderr)
+
+    results = run_benchmarks(args.select, args.samples, args.min_time, args.counts, report)
+
+    if args.output:
+        save_results(args.output, results)
+    if args.save_baseline:
+        save_results(DEFAULT_BASELINE, results)
+    if not args.output and not args.save_baseline:
+        json.dump(results, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    if args.compare:
+        regressions = compare(results, load_results(args.compare), args.threshold)
+        for key, before, after, ratio in regressions:
+            print(f"REGRESSION {key}: {before * 1e3:.3f} ms -> {after * 1e3:.3f} ms ({ratio:.2f}x)",
+                  file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
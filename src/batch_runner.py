@@ -0,0 +1,136 @@
+"""Simulate many seeded games in parallel and collect their results.
+
+Usage:
+    python -m src.batch_runner --runs 1000 --output results.csv
+"""
+import argparse
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Workers never open a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from src.constants import ELITE_TYPES  # noqa: E402
+from src.game import GameSimulation  # noqa: E402
+from src.headless import HEADLESS_DT, run_headless  # noqa: E402
+from src.utils.input_source import InputState, RandomInput, ScriptedInput  # noqa: E402
+from src.utils.rng import GameRNG  # noqa: E402
+
+DEFAULT_MAX_TICKS = 60 * 60 * 10  # Ten simulated minutes at 60 ticks per second
+
+RESULT_COLUMNS = (
+    ["seed", "policy", "wave", "credits", "ticks", "ticks_per_second", "game_over", "perks"]
+    + [f"kills_{elite_type}" for elite_type in ELITE_TYPES]
+)
+
+
+def make_policy(name, rng):
+    """Build the input source for one run.
+
+    Args:
+        name: 'random' for RandomInput, or 'turret' to spin in place and fire
+        rng: The game's GameRNG, for policies that make random choices
+
+    Returns:
+        An input source with a poll(events) method
+    """
+    if name == "random":
+        return RandomInput(rng=rng.stream(GameRNG.INPUT))
+    if name == "turret":
+        return ScriptedInput([InputState(rotate_right=True, shoot=True, perk_choice=0)], loop=True)
+    raise ValueError(f"Unknown input policy: {name}")
+
+
+def run_game(seed, policy="random", max_ticks=DEFAULT_MAX_TICKS, dt=HEADLESS_DT):
+    """Play one seeded game to completion in the current process.
+
+    Returns:
+        dict: One result row keyed by RESULT_COLUMNS
+    """
+    simulation = GameSimulation(seed=seed, verbose=False)
+    result = run_headless(max_ticks, make_policy(policy, simulation.rng), dt, simulation)
+
+    row = {
+        "seed": seed,
+        "policy": policy,
+        "wave": result["wave"],
+        "credits": result["credits"],
+        "ticks": result["ticks"],
+        "ticks_per_second": round(result["ticks_per_second"], 1),
+        "game_over": int(result["game_over"]),
+        "perks": ";".join(perk.name for perk in simulation.player.perks),
+    }
+    for elite_type in ELITE_TYPES:
+        row[f"kills_{elite_type}"] = simulation.elite_kills.get(elite_type, 0)
+    return row
+
+
+def run_batch(seeds, policy="random", max_ticks=DEFAULT_MAX_TICKS, workers=None):
+    """Run one game per seed across a process pool.
+
+    Args:
+        seeds: Iterable of integer seeds
+        policy: Input policy name passed to make_policy
+        max_ticks: Tick limit for each game
+        workers: Number of worker processes (defaults to the CPU count)
+
+    Yields:
+        dict: Result rows in the order the games finish
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_game, seed, policy, max_ticks) for seed in seeds]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def write_csv(rows, path):
+    """Stream result rows to a CSV file as they arrive."""
+    count = 0
+    with open(path, "w", newline="") as output:
+        writer = csv.DictWriter(output, fieldnames=RESULT_COLUMNS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            output.flush()
+            count += 1
+    return count
+
+
+def write_npz(rows, path):
+    """Collect result rows into columns and save them as a NumPy .npz file."""
+    import numpy as np
+
+    columns = {name: [] for name in RESULT_COLUMNS}
+    for row in rows:
+        for name in RESULT_COLUMNS:
+            columns[name].append(row[name])
+    np.savez_compressed(path, **{name: np.asarray(values) for name, values in columns.items()})
+    return len(columns["seed"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate many games in parallel.")
+    parser.add_argument("--runs", type=int, default=100, help="number of games to simulate")
+    parser.add_argument("--first-seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--policy", choices=("random", "turret"), default="random",
+                        help="input policy for every game")
+    parser.add_argument("--max-ticks", type=int, default=DEFAULT_MAX_TICKS,
+                        help="tick limit for each game")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument("--output", default="batch_results.csv",
+                        help="output file; .npz writes NumPy columns, anything else CSV")
+    args = parser.parse_args()
+
+    seeds = range(args.first_seed, args.first_seed + args.runs)
+    rows = run_batch(seeds, args.policy, args.max_ticks, args.workers)
+    if args.output.endswith(".npz"):
+        count = write_npz(rows, args.output)
+    else:
+        count = write_csv(rows, args.output)
+    print(f"Wrote {count} runs to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
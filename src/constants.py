@@ -16,12 +16,73 @@ PLAYER_MAX_HP = 3
 
 SHOT_RADIUS = 5
 
+# Game logic runs in fixed steps, independent of the render frame rate.
+# Per-tick chances (elite turns and priming) are tuned for 60 steps/s.
+SIMULATION_RATE = 60  # Steps per second
+MAX_CATCH_UP_STEPS = 5  # Most steps simulated in one rendered frame
+RENDER_FPS = 60  # Frame rate cap for drawing
+
+# Keep asteroid and shot state in NumPy component arrays and step each kind
+# in one vectorized pass (ignored when NumPy is not installed). The stores
+# only take over once there are enough entities to pay for their per-tick
+# array overhead, and hand back when fewer than half that many are left.
+USE_ASTEROID_STORE = True
+USE_SHOT_STORE = True
+STORE_MIN_ENTITIES = 48  # Asteroids plus shots; crossover from simulation.tick_*
+
+# Object pools: killed shots and asteroids are reused instead of rebuilt
+USE_OBJECT_POOLS = True
+POOL_DEFAULT_CAP = 128  # Free instances kept per class
+POOL_CAPS = {
+    'Shot': 256,
+    'Asteroid': 512,
+}
+
+# Pre-rendered asteroid sprites; animation is quantized so frames can be reused
+SPRITE_CACHE_SIZE = 1024  # Sprites kept before the least recently used is dropped
+SPRITE_PULSE_STEPS = 12  # Frames per pulse cycle
+SPRITE_SHIELD_STEP = 10  # Degrees between cached shield arc angles
+
+# Dirty-rectangle rendering: redraw and update only the areas sprites touched
+USE_DIRTY_RECTS = False
+DIRTY_RECT_THRESHOLD = 0.5  # Fraction of the screen above which a full flip is used
+
+# Profiler: recent samples kept per timing scope (4 seconds at 60 FPS)
+PROFILER_SAMPLES = 240
+
+# Render layers, drawn back to front
+LAYER_ASTEROIDS = 0
+LAYER_SHOTS = 1
+LAYER_PLAYER = 2
+LAYER_HUD = 3
+RENDER_LAYERS = ('asteroids', 'shots', 'player', 'hud')
+
 # Elite asteroid settings
 ELITE_SPAWN_CHANCE = 0.15  # 15% chance of an asteroid being elite
 ELITE_MIN_WAVE = 3  # Elites start appearing from wave 3
+SHIELD_ROTATION_SPEED = 45  # Degrees per second a shield turns
+SHIELD_HIT_DAMAGE = 0.5  # Damage from a shot that strikes the shield arc
+SWARM_LEADER_TURN_CHANCE = 0.01  # Per-tick chance of a sharp turn
+SWARM_LEADER_TURN_ANGLE = 45  # Degrees turned, either way
+EXPLODER_PRIME_CHANCE = 0.005  # Per-tick chance to prime once health is low
+EXPLODER_PRIME_HEALTH = 2  # Health at or below which exploders may prime
+
+# Swarm leaders steer asteroids within their influence radius, boids-style.
+# Rates are per second; followers keep their speed and only turn.
+SWARM_ALIGNMENT = 0.8  # Turn towards the leader's heading
+SWARM_COHESION = 0.3  # Turn towards the leader
+SWARM_SEPARATION = 2.0  # Turn away when closer than the gap below
+SWARM_SEPARATION_GAP = 20  # Pixels between leader and follower edges
+
+# Primed exploders damage everything within their blast when destroyed,
+# possibly setting off other exploders
+EXPLODER_BLAST_SCALE = 3  # Blast radius as a multiple of the exploder's radius
+EXPLODER_BLAST_DAMAGE = 1  # Damage per blast that reaches an asteroid
 
 # Wave settings
 WAVE_COUNTDOWN = 3.0  # Seconds to wait before a wave starts
+WAVE_SPAWN_TIME = 1.0  # Seconds over which a wave's asteroids enter
+WAVE_SPAWN_BUDGET = 10  # Most planned asteroids created in one tick
 PERK_SELECTION_AFTER_WAVE = True  # Whether to show perk selection after wave
 
 # Elite types
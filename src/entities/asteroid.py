@@ -3,20 +3,39 @@ import random
 import pygame
 
 from src.utils.circleshape import CircleShape
-from src.constants import ASTEROID_MIN_RADIUS, SCREEN_HEIGHT, SCREEN_WIDTH
+from src.utils.sprite_cache import blank_sprite
+from src.constants import ASTEROID_MIN_RADIUS, LAYER_ASTEROIDS, SCREEN_HEIGHT, SCREEN_WIDTH
 
 
 class Asteroid(CircleShape):
+    # Random source for splitting; the game assigns its own seeded stream
+    rng = random
+    render_layer = LAYER_ASTEROIDS
+
     def __init__(self, x, y, radius):
         super().__init__(x, y, radius)
         self.health = 1  # Regular asteroids have 1 health
         self.credits_value = 1  # Credits given when destroyed
 
-    def draw(self, screen):
-        pygame.draw.circle(screen, "white", self.position, self.radius, 2)
+    def reset(self, x, y, radius):
+        super().reset(x, y, radius)
+        self.health = 1
+        self.credits_value = 1
+
+    def sprite_key(self):
+        """Describe everything that changes how this asteroid looks"""
+        return ('asteroid', self.radius)
+
+    def render_sprite(self, key):
+        """Draw the sprite for a sprite_key() onto a new surface"""
+        _, radius = key
+        surface, center = blank_sprite(radius)
+        pygame.draw.circle(surface, "white", center, radius, 2)
+        return surface
 
     def update(self, dt):
         # move and wrap around the screen
+        self.previous_position.update(self.position)
         self.position += self.velocity * dt
         self.position.x %= SCREEN_WIDTH
         self.position.y %= SCREEN_HEIGHT
@@ -45,14 +64,14 @@ class Asteroid(CircleShape):
         if self.radius <= ASTEROID_MIN_RADIUS:
             return children
         else:
-            random_angle = random.uniform(20, 50)
+            random_angle = self.rng.uniform(20, 50)
             new_vector_1 = self.velocity.rotate(random_angle)
             new_vector_2 = self.velocity.rotate(-random_angle)
             new_radius = self.radius - ASTEROID_MIN_RADIUS
 
             # Create new asteroids
-            new_asteroid_1 = Asteroid(self.position.x, self.position.y, new_radius)
-            new_asteroid_2 = Asteroid(self.position.x, self.position.y, new_radius)
+            new_asteroid_1 = Asteroid.acquire(self.position.x, self.position.y, new_radius)
+            new_asteroid_2 = Asteroid.acquire(self.position.x, self.position.y, new_radius)
 
             # Set velocities
             new_asteroid_1.velocity = new_vector_1 * 1.2
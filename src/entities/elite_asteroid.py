@@ -1,13 +1,35 @@
-import random
 import pygame
 import math
 
 from src.entities.asteroid import Asteroid
-from src.constants import ASTEROID_MIN_RADIUS
+from src.constants import (
+    ASTEROID_MIN_RADIUS,
+    EXPLODER_PRIME_CHANCE,
+    EXPLODER_PRIME_HEALTH,
+    SHIELD_HIT_DAMAGE,
+    SHIELD_ROTATION_SPEED,
+    SPRITE_SHIELD_STEP,
+    SWARM_LEADER_TURN_ANGLE,
+    SWARM_LEADER_TURN_CHANCE,
+)
+from src.utils.sprite_cache import blank_sprite, pulse_angle, pulse_step
+
+
+def angular_offset(angle, reference):
+    """Return angle - reference in degrees, normalized to [-180, 180).
+
+    Works the same on plain numbers and on NumPy arrays.
+    """
+    return (angle - reference + 180) % 360 - 180
+
 
 class EliteAsteroid(Asteroid):
     """Base class for all Elite Asteroids with common functionality"""
 
+    elite_type = 'elite'  # Key used in ELITE_TYPES and kill statistics
+    # NeighborIndex of live asteroids for area queries; the game assigns its own
+    neighbor_index = None
+
     def __init__(self, x, y, radius):
         super().__init__(x, y, radius)
         # Common properties all elites share
@@ -15,6 +37,12 @@ class EliteAsteroid(Asteroid):
         self.credits_value = 5
         self.time_alive = 0
 
+    def reset(self, x, y, radius):
+        super().reset(x, y, radius)
+        self.health = 3
+        self.credits_value = 5
+        self.time_alive = 0
+
     def update(self, dt):
         """Update with base elite behavior"""
         super().update(dt)
@@ -24,7 +52,11 @@ class EliteAsteroid(Asteroid):
         self.special_behavior(dt)
 
     def special_behavior(self, dt):
-        """To be implemented by subclasses"""
+        """To be implemented by subclasses
+
+        Elites in an AsteroidStore are not called one by one; the store runs
+        a batched version of each kind's behaviour instead.
+        """
         pass
 
     def take_damage(self, attack_angle=None):
@@ -34,7 +66,7 @@ class EliteAsteroid(Asteroid):
 
     def create_standard_children(self):
         """Create standard asteroid children"""
-        random_angle = random.uniform(20, 50)
+        random_angle = self.rng.uniform(20, 50)
         new_vector_1 = self.velocity.rotate(random_angle)
         new_vector_2 = self.velocity.rotate(-random_angle)
         new_radius = self.radius - ASTEROID_MIN_RADIUS
@@ -44,8 +76,8 @@ class EliteAsteroid(Asteroid):
         if new_radius >= ASTEROID_MIN_RADIUS:
             # Create child asteroids of the same class
             child_class = self.__class__
-            new_asteroid_1 = child_class(self.position.x, self.position.y, new_radius)
-            new_asteroid_2 = child_class(self.position.x, self.position.y, new_radius)
+            new_asteroid_1 = child_class.acquire(self.position.x, self.position.y, new_radius)
+            new_asteroid_2 = child_class.acquire(self.position.x, self.position.y, new_radius)
 
             # Reduce health for children
             new_asteroid_1.health = max(2, self.health - 1)
@@ -63,43 +95,60 @@ class EliteAsteroid(Asteroid):
 class ExploderAsteroid(EliteAsteroid):
     """Elite asteroid that explodes into multiple fragments when destroyed"""
 
+    elite_type = 'exploder'
+
     def __init__(self, x, y, radius):
         super().__init__(x, y, radius)
         self.explosion_primed = False
         self.color = (255, 100, 50)  # Red-orange
 
-    def draw(self, screen):
+    def reset(self, x, y, radius):
+        super().reset(x, y, radius)
+        self.explosion_primed = False
+
+    def sprite_key(self):
+        """Pulse frame, plus the cross pulse frame once primed"""
+        return ('exploder', self.radius, self.color, pulse_step(self.time_alive, 8),
+                self.explosion_primed,
+                pulse_step(self.time_alive, 10) if self.explosion_primed else 0)
+
+    def render_sprite(self, key):
         """Draw exploder asteroid with crosses inside"""
+        _, radius, color, pulse, primed, cross_pulse = key
+        surface, center = blank_sprite(radius)
+        center = pygame.Vector2(center)
+
         # Draw base asteroid with pulsing effect - higher frequency and wider amplitude
-        intensity = (math.sin(self.time_alive * 8) * 0.5) + 0.7
-        pulse_color = tuple(min(255, int(c * intensity)) for c in self.color)
+        intensity = (math.sin(pulse_angle(pulse)) * 0.5) + 0.7
+        pulse_color = tuple(min(255, int(c * intensity)) for c in color)
 
         # Draw the asteroid base
-        pygame.draw.circle(screen, pulse_color, self.position, self.radius, 2)
+        pygame.draw.circle(surface, pulse_color, center, radius, 2)
 
         # Draw crosses inside
-        size = self.radius * 0.3
-        center = self.position
+        size = radius * 0.3
 
         # Make the cross pulse if primed to explode
-        line_width = 3 if self.explosion_primed else 2
+        line_width = 3 if primed else 2
 
         # Additional pulsing effect for the cross size when primed
-        if self.explosion_primed:
-            pulse_size = size * (0.8 + math.sin(self.time_alive * 10) * 0.2)
+        if primed:
+            pulse_size = size * (0.8 + math.sin(pulse_angle(cross_pulse)) * 0.2)
         else:
             pulse_size = size
 
-        pygame.draw.line(screen, pulse_color,
+        pygame.draw.line(surface, pulse_color,
                         (center.x - pulse_size, center.y - pulse_size),
                         (center.x + pulse_size, center.y + pulse_size), line_width)
-        pygame.draw.line(screen, pulse_color,
+        pygame.draw.line(surface, pulse_color,
                         (center.x - pulse_size, center.y + pulse_size),
                         (center.x + pulse_size, center.y - pulse_size), line_width)
+        return surface
 
     def special_behavior(self, dt):
         """Randomly prime for explosion when health is low"""
-        if self.health <= 2 and not self.explosion_primed and random.random() < 0.005:
+        if (self.health <= EXPLODER_PRIME_HEALTH and not self.explosion_primed
+                and self.rng.random() < EXPLODER_PRIME_CHANCE):
             self.explosion_primed = True
 
     def take_damage(self, attack_angle=None):
@@ -107,7 +156,7 @@ class ExploderAsteroid(EliteAsteroid):
         self.health -= 1
 
         # Chance to prime explosion when damaged
-        if not self.explosion_primed and self.health <= 2 and random.random() < 0.3:
+        if not self.explosion_primed and self.health <= EXPLODER_PRIME_HEALTH and self.rng.random() < 0.3:
             self.explosion_primed = True
 
         return self.health <= 0
@@ -124,11 +173,11 @@ class ExploderAsteroid(EliteAsteroid):
         fragment_count = 8 if self.explosion_primed else 5  # More fragments if primed
 
         for _ in range(fragment_count):
-            angle = random.uniform(0, 360)
+            angle = self.rng.uniform(0, 360)
             new_vector = self.velocity.rotate(angle)
             new_radius = max(ASTEROID_MIN_RADIUS, self.radius / 3)
 
-            new_asteroid = Asteroid(self.position.x, self.position.y, new_radius)
+            new_asteroid = Asteroid.acquire(self.position.x, self.position.y, new_radius)
             new_asteroid.velocity = new_vector * (2.0 if self.explosion_primed else 1.5)
             children.append(new_asteroid)
 
@@ -138,6 +187,8 @@ class ExploderAsteroid(EliteAsteroid):
 class ShieldedAsteroid(EliteAsteroid):
     """Elite asteroid with a shield that reduces damage from certain angles"""
 
+    elite_type = 'shielded'
+
     def __init__(self, x, y, radius):
         super().__init__(x, y, radius)
         self.health = 4  # Shielded asteroids are tougher
@@ -146,33 +197,52 @@ class ShieldedAsteroid(EliteAsteroid):
         self.shield_angle = 0
         self.shield_arc_width = 180  # Degrees - wider arc
         self.color = (50, 100, 255)  # Blue
-        self.rotation_speed = 45  # Degrees per second
+        self.rotation_speed = SHIELD_ROTATION_SPEED  # Degrees per second
 
-    def draw(self, screen):
+    def reset(self, x, y, radius):
+        super().reset(x, y, radius)
+        self.health = 4
+        self.shield_active = True
+        self.shield_angle = 0
+
+    def sprite_key(self):
+        """Pulse frame and shield angle, rounded to SPRITE_SHIELD_STEP degrees"""
+        if self.shield_active:
+            shield_angle = round(self.shield_angle / SPRITE_SHIELD_STEP) * SPRITE_SHIELD_STEP % 360
+        else:
+            shield_angle = None
+        return ('shielded', self.radius, self.color, pulse_step(self.time_alive, 5),
+                shield_angle, self.shield_arc_width, self.damage_reduction)
+
+    def render_sprite(self, key):
         """Draw shielded asteroid with shield arc"""
+        _, radius, color, pulse, shield_angle, shield_arc_width, damage_reduction = key
+        surface, center = blank_sprite(radius + 5)
+
         # Draw base asteroid with pulsing effect
-        intensity = (math.sin(self.time_alive * 5) * 0.3) + 0.7
-        pulse_color = tuple(min(255, int(c * intensity)) for c in self.color)
+        intensity = (math.sin(pulse_angle(pulse)) * 0.3) + 0.7
+        pulse_color = tuple(min(255, int(c * intensity)) for c in color)
 
         # Draw the asteroid base
-        pygame.draw.circle(screen, pulse_color, self.position, self.radius, 2)
+        pygame.draw.circle(surface, pulse_color, center, radius, 2)
 
         # Draw shield arc
-        if self.shield_active:
+        if shield_angle is not None:
             shield_rect = pygame.Rect(
-                self.position.x - self.radius - 5,
-                self.position.y - self.radius - 5,
-                self.radius * 2 + 10,
-                self.radius * 2 + 10
+                center[0] - radius - 5,
+                center[1] - radius - 5,
+                radius * 2 + 10,
+                radius * 2 + 10
             )
 
-            half_width = self.shield_arc_width / 2
+            half_width = shield_arc_width / 2
 
             # Draw shield with thickness based on damage reduction
-            shield_thickness = 3 + int(self.damage_reduction * 3)
-            pygame.draw.arc(screen, pulse_color, shield_rect,
-                        math.radians(self.shield_angle - half_width),
-                        math.radians(self.shield_angle + half_width), shield_thickness)
+            shield_thickness = 3 + int(damage_reduction * 3)
+            pygame.draw.arc(surface, pulse_color, shield_rect,
+                        math.radians(shield_angle - half_width),
+                        math.radians(shield_angle + half_width), shield_thickness)
+        return surface
 
     def special_behavior(self, dt):
         """Rotate shield quickly around the asteroid"""
@@ -180,18 +250,14 @@ class ShieldedAsteroid(EliteAsteroid):
         self.shield_angle = (self.shield_angle + self.rotation_speed * dt) % 360
 
     def is_vulnerable_to_attack(self, attack_angle):
-        """Check if vulnerable from a specific angle"""
-        half_width = self.shield_arc_width / 2
+        """Check if vulnerable from a specific angle
 
-        # Check if attack angle is outside shield arc
-        min_angle = (self.shield_angle - half_width) % 360
-        max_angle = (self.shield_angle + half_width) % 360
-
-        if min_angle < max_angle:
-            return attack_angle < min_angle or attack_angle > max_angle
-        else:
-            # Handle wrap-around case
-            return attack_angle < min_angle and attack_angle > max_angle
+        The shield covers every angle within half its arc width of
+        shield_angle, edges included, so this is one comparison on the
+        offset from the shield's centre; AsteroidStore.hit_damage does the
+        same for arrays of hits.
+        """
+        return abs(angular_offset(attack_angle, self.shield_angle)) > self.shield_arc_width / 2
 
     def take_damage(self, attack_angle=None):
         """Take damage based on attack angle"""
@@ -199,7 +265,7 @@ class ShieldedAsteroid(EliteAsteroid):
             # Check if attack hits shield
             if not self.is_vulnerable_to_attack(attack_angle):
                 # Hit shield - reduced damage
-                self.health -= 0.5
+                self.health -= SHIELD_HIT_DAMAGE
             else:
                 # Hit vulnerable spot - full damage
                 self.health -= 1
@@ -220,34 +286,54 @@ class ShieldedAsteroid(EliteAsteroid):
 
 
 class SwarmLeaderAsteroid(EliteAsteroid):
-    """Elite asteroid that makes unpredictable movements and influences nearby asteroids"""
+    """Elite asteroid that makes unpredictable movements and influences nearby asteroids
+
+    Asteroids within influence_radius flock after the leader; the steering
+    itself is done for all leaders at once by SwarmManager.
+    """
+
+    elite_type = 'swarm_leader'
 
     def __init__(self, x, y, radius):
         super().__init__(x, y, radius)
         self.influence_radius = radius * 5
         self.color = (200, 50, 200)  # Purple
 
-    def draw(self, screen):
+    def reset(self, x, y, radius):
+        super().reset(x, y, radius)
+        self.influence_radius = radius * 5
+
+    def sprite_key(self):
+        """Color pulse frame and orbital ring pulse frame"""
+        return ('swarm_leader', self.radius, self.color, pulse_step(self.time_alive, 5),
+                pulse_step(self.time_alive, 3))
+
+    def render_sprite(self, key):
         """Draw swarm leader with orbital rings"""
+        _, radius, color, pulse, ring_pulse = key
+        surface, center = blank_sprite(radius + 18)
+
         # Draw base asteroid with pulsing effect
-        intensity = (math.sin(self.time_alive * 5) * 0.3) + 0.7
-        pulse_color = tuple(min(255, int(c * intensity)) for c in self.color)
+        intensity = (math.sin(pulse_angle(pulse)) * 0.3) + 0.7
+        pulse_color = tuple(min(255, int(c * intensity)) for c in color)
 
         # Draw the asteroid base
-        pygame.draw.circle(screen, pulse_color, self.position, self.radius, 2)
+        pygame.draw.circle(surface, pulse_color, center, radius, 2)
 
         # Draw orbital circles that pulse
-        pulse_radius_1 = self.radius + 8 + (math.sin(self.time_alive * 3) * 3)
-        pulse_radius_2 = self.radius + 15 + (math.sin(self.time_alive * 3 + 1) * 3)
+        ring_angle = pulse_angle(ring_pulse)
+        pulse_radius_1 = radius + 8 + (math.sin(ring_angle) * 3)
+        pulse_radius_2 = radius + 15 + (math.sin(ring_angle + 1) * 3)
 
-        pygame.draw.circle(screen, pulse_color, self.position, pulse_radius_1, 1)
-        pygame.draw.circle(screen, pulse_color, self.position, pulse_radius_2, 1)
+        pygame.draw.circle(surface, pulse_color, center, pulse_radius_1, 1)
+        pygame.draw.circle(surface, pulse_color, center, pulse_radius_2, 1)
+        return surface
 
     def special_behavior(self, dt):
         """Make unpredictable turns occasionally"""
-        if random.random() < 0.01:
+        if self.rng.random() < SWARM_LEADER_TURN_CHANCE:
             # Make a sharper turn
-            turn_angle = random.choice([-45, 45])
+            turn_angle = self.rng.choice([-SWARM_LEADER_TURN_ANGLE, SWARM_LEADER_TURN_ANGLE])
             self.velocity = self.velocity.rotate(turn_angle)
 
     def split(self):
@@ -271,9 +357,9 @@ def create_elite_asteroid(x, y, radius, elite_type):
 
     elite_class = elite_classes.get(elite_type)
     if elite_class:
-        return elite_class(x, y, radius)
+        return elite_class.acquire(x, y, radius)
     else:
         # Fallback to base class if type not found
-        asteroid = EliteAsteroid(x, y, radius)
+        asteroid = EliteAsteroid.acquire(x, y, radius)
         asteroid.color = (255, 255, 255)  # White as fallback
         return asteroid
\ No newline at end of file
@@ -1,7 +1,9 @@
 import pygame
 
 from src.utils.circleshape import CircleShape
+from src.utils.sprite_cache import blank_sprite
 from src.constants import (
+    LAYER_PLAYER,
     PLAYER_RADIUS,
     PLAYER_SHOOT_COOLDOWN,
     PLAYER_SHOOT_SPEED,
@@ -12,9 +14,12 @@ from src.constants import (
     SCREEN_HEIGHT,
 )
 from src.entities.shot import Shot
+from src.utils.input_source import InputState
 
 
 class Player(CircleShape):
+    render_layer = LAYER_PLAYER
+
     def __init__(self, x, y, shots_group):
         super().__init__(x, y, PLAYER_RADIUS)
         self.rotation = 0
@@ -31,45 +36,62 @@ class Player(CircleShape):
         self.bullet_pierce = 0
         self.active_abilities = []
 
-    def triangle(self):
-        forward = pygame.Vector2(0, 1).rotate(self.rotation)
-        right = pygame.Vector2(0, 1).rotate(self.rotation + 90) * self.radius / 1.5
-        a = self.position + forward * self.radius
-        b = self.position - forward * self.radius - right
-        c = self.position - forward * self.radius + right
+        # Controls for the current tick, set by the simulation
+        self.controls = InputState()
+
+    def triangle(self, position=None, rotation=None):
+        if position is None:
+            position = self.position
+        if rotation is None:
+            rotation = self.rotation
+        forward = pygame.Vector2(0, 1).rotate(rotation)
+        right = pygame.Vector2(0, 1).rotate(rotation + 90) * self.radius / 1.5
+        a = position + forward * self.radius
+        b = position - forward * self.radius - right
+        c = position - forward * self.radius + right
         return [a, b, c]
 
-    def draw(self, screen):
+    def sprite_key(self):
+        # Rotation is cached to the nearest degree
+        return ('player', self.radius, round(self.rotation) % 360, len(self.active_abilities))
+
+    def render_sprite(self, key):
+        _, radius, rotation, ability_count = key
+        ability_radius = radius + 5
+        surface, center = blank_sprite(max(radius * 1.2, ability_radius + 3))
+        center = pygame.Vector2(center)
+
         # Draw the player ship
-        pygame.draw.polygon(screen, "white", self.triangle(), 2)
+        pygame.draw.polygon(surface, "white", self.triangle(center, rotation), 2)
 
         # Draw active ability indicators if any
-        ability_radius = self.radius + 5
-        for i, ability in enumerate(self.active_abilities):
+        for i in range(ability_count):
             angle_offset = i * 45  # Spread indicators around the ship
-            indicator_pos = self.position + pygame.Vector2(0, ability_radius).rotate(self.rotation + angle_offset)
-            pygame.draw.circle(screen, (0, 255, 0), indicator_pos, 3)
+            indicator_pos = center + pygame.Vector2(0, ability_radius).rotate(rotation + angle_offset)
+            pygame.draw.circle(surface, (0, 255, 0), indicator_pos, 3)
+        return surface
 
     def rotate(self, dt):
         self.rotation += PLAYER_TURN_SPEED * dt
 
     def update(self, dt):
-        keys = pygame.key.get_pressed()
+        self.previous_position.update(self.position)
+        controls = self.controls
 
-        if keys[pygame.K_a]:
+        if controls.rotate_left:
             self.rotate(-dt)
-        if keys[pygame.K_d]:
+        if controls.rotate_right:
             self.rotate(dt)
-        if keys[pygame.K_w]:
+        if controls.thrust:
             self.move(dt)
-        if keys[pygame.K_s]:
+        if controls.reverse:
             self.move(-dt)
-        if keys[pygame.K_SPACE]:
+        if controls.shoot:
             self.shoot()
 
         # Ability keys (1-5)
-        for i, key in enumerate([pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5]):
-            if keys[key] and i < len(self.active_abilities):
+        for i, pressed in enumerate(controls.abilities):
+            if pressed and i < len(self.active_abilities):
                 self.use_ability(i)
 
         # Cooldown timer
@@ -89,10 +111,9 @@ class Player(CircleShape):
             # Don't print anything when on cooldown
             return
         else:
-            new_shot = Shot(self.position.x, self.position.y)
-            new_shot.velocity = (
-                pygame.Vector2(0, 1).rotate(self.rotation) * PLAYER_SHOOT_SPEED
-            )
+            new_shot = Shot.acquire(self.position.x, self.position.y)
+            # Assign rather than mutate: stored shots hand out copies
+            new_shot.velocity = pygame.Vector2(0, PLAYER_SHOOT_SPEED).rotate(self.rotation)
 
             # Apply bullet pierce from perks
             if self.bullet_pierce > 0:
@@ -1,37 +1,46 @@
 import pygame
-import math
 
 from src.utils.circleshape import CircleShape
-from src.constants import SHOT_RADIUS, SCREEN_WIDTH, SCREEN_HEIGHT
+from src.utils.sprite_cache import blank_sprite
+from src.constants import LAYER_SHOTS, SHOT_RADIUS
 
 
 class Shot(CircleShape):
+    render_layer = LAYER_SHOTS
+
     def __init__(self, x, y):
         super().__init__(x, y, SHOT_RADIUS)
         self.velocity = pygame.Vector2(0, 0)
         self.pierce = 0  # How many additional enemies this shot can pierce
         self.lifetime = 2.0  # Shots disappear after 2 seconds
 
-    def draw(self, screen):
+    def reset(self, x, y):
+        super().reset(x, y, SHOT_RADIUS)
+        self.pierce = 0
+        self.lifetime = 2.0
+
+    def sprite_key(self):
+        return ('shot', self.radius, self.pierce > 0)
+
+    def render_sprite(self, key):
+        _, radius, piercing = key
+        surface, center = blank_sprite(radius + 1)
         # Draw differently if it has pierce ability
-        if self.pierce > 0:
+        if piercing:
             # Draw a filled circle with outline for piercing shots
-            pygame.draw.circle(screen, "white", self.position, self.radius, 0)
-            pygame.draw.circle(screen, (200, 200, 50), self.position, self.radius + 1, 1)
+            pygame.draw.circle(surface, "white", center, radius, 0)
+            pygame.draw.circle(surface, (200, 200, 50), center, radius + 1, 1)
         else:
             # Standard shot
-            pygame.draw.circle(screen, "white", self.position, self.radius, 0)
+            pygame.draw.circle(surface, "white", center, radius, 0)
+        return surface
 
     def update(self, dt):
         # move and wrap around the screen
+        self.previous_position.update(self.position)
         self.position += self.velocity * dt
 
-        # Check if shot is off-screen and remove if it is
-        if (self.position.x < -self.radius or
-            self.position.x > SCREEN_WIDTH + self.radius or
-            self.position.y < -self.radius or
-            self.position.y > SCREEN_HEIGHT + self.radius):
-            self.kill()
+        self.topology.wrap(self.position)
 
         # Decrement lifetime
         self.lifetime -= dt
@@ -45,28 +54,26 @@ class Shot(CircleShape):
         """
         # Calculate direction vector from target to shot
         # This is the direction the shot is coming FROM relative to the target
-        direction = self.position - target_position
-
-        # Calculate angle in degrees (0-360) using atan2
-        angle = math.degrees(math.atan2(direction.y, direction.x)) % 360
-
-        return angle
+        # (the shortest way round the wrapping world)
+        return self.topology.angle(target_position, self.position)
 
     def collision_check(self, circle_object):
         """Check for collision and handle piercing"""
-        if (self.position.distance_to(circle_object.position)
-            < self.radius + circle_object.radius):
+        if self.topology.overlaps(self.position, self.radius,
+                                  circle_object.position, circle_object.radius):
 
             # Calculate attack angle for the collision
             attack_angle = self.get_attack_angle(circle_object.position)
+            self.register_hit()
+            return True, attack_angle
 
-            if self.pierce > 0:
-                # Reduce pierce count instead of destroying the shot
-                self.pierce -= 1
-                return True, attack_angle
-            else:
-                # Standard behavior - shot is destroyed on hit
-                self.kill()
-                return True, attack_angle
+        return False, None
 
-        return False, None
\ No newline at end of file
+    def register_hit(self):
+        """Use up one pierce, or destroy the shot if it has none left"""
+        if self.pierce > 0:
+            # Reduce pierce count instead of destroying the shot
+            self.pierce -= 1
+        else:
+            # Standard behavior - shot is destroyed on hit
+            self.kill()
\ No newline at end of file
@@ -0,0 +1,382 @@
+import contextlib
+import math
+import time
+
+import pygame
+
+from src.constants import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    ASTEROID_KINDS,
+    ELITE_MIN_WAVE,
+    ELITE_SPAWN_CHANCE,
+    ELITE_TYPES,
+    WAVE_COUNTDOWN,
+    WAVE_SPAWN_BUDGET,
+    WAVE_SPAWN_TIME,
+    PERK_SELECTION_AFTER_WAVE,
+    STATE_PLAYING,
+    STATE_WAVE_TRANSITION,
+    STATE_PERK_SELECTION,
+    STATE_GAME_OVER,
+    STORE_MIN_ENTITIES,
+    USE_ASTEROID_STORE,
+    USE_OBJECT_POOLS,
+    USE_SHOT_STORE
+)
+from src.entities.asteroid import Asteroid
+from src.entities.elite_asteroid import EliteAsteroid, ExploderAsteroid
+from src.entities.player import Player
+from src.entities.shot import Shot
+from src.managers.asteroid_field import SpawnPlan
+from src.managers.asteroid_store import AsteroidStore
+from src.managers.collision_manager import CollisionManager
+from src.managers.explosion_manager import ExplosionManager
+from src.managers.perk_manager import PerkManager
+from src.managers.pool_manager import PoolManager
+from src.managers.shot_store import ShotStore
+from src.managers.swarm_manager import SwarmManager
+from src.utils.input_source import InputState
+from src.utils.neighbor_index import NeighborIndex
+from src.utils.profiler import Profiler
+from src.utils.rng import GameRNG
+
+
+class GameSimulation:
+    """Game state and per-tick game logic, independent of any window.
+
+    Owns the sprite groups, player and managers, and advances waves,
+    movement and collisions one tick at a time from an InputState. main()
+    drives it from the keyboard and draws it; headless runs drive it from
+    scripted or random input without opening a display.
+    """
+
+    def __init__(self, seed=None, verbose=True):
+        """Create a new game, waiting for the first wave's countdown.
+
+        Args:
+            seed: Game seed; the same seed and inputs replay the same game.
+                A random seed is picked when None.
+            verbose: Print game events (perk picks, game over) to stdout
+        """
+        self.verbose = verbose
+
+        self.updateables = pygame.sprite.Group()
+        self.drawables = pygame.sprite.Group()
+        self.asteroids = pygame.sprite.Group()
+        self.shots = pygame.sprite.Group()
+
+        # Asteroids and shots are stepped by component stores instead of
+        # updateables when available and there are enough of them; see
+        # use_stores(). asteroid_store, shot_store and stores name the
+        # stores in use, or None and ().
+        self.available_stores = (
+            AsteroidStore() if USE_ASTEROID_STORE and AsteroidStore.available else None,
+            ShotStore() if USE_SHOT_STORE and ShotStore.available else None,
+        )
+        self.asteroid_store = None
+        self.shot_store = None
+        self.stores = ()
+
+        # Killed shots and asteroids are recycled through per-class pools
+        self.pool_manager = PoolManager() if USE_OBJECT_POOLS else None
+
+        # Live asteroids by location, refreshed every tick for area queries
+        self.neighbor_index = NeighborIndex()
+
+        # The next wave's asteroids, planned during its countdown
+        self.spawn_plan = SpawnPlan()
+
+        self.collision_manager = CollisionManager(self.asteroids, self.shots)
+        self.swarm_manager = SwarmManager(self.asteroids, self.neighbor_index)
+        self.explosion_manager = ExplosionManager(self.neighbor_index)
+
+        self.recorder = None  # Optional ReplayWriter logging every tick's input
+        self.profiler = Profiler(enabled=False)  # Replace to time the tick phases
+        self.player = None
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        """Start a new game in place, waiting for the first wave's countdown.
+
+        The groups, store, pools and managers are kept. Live shots and
+        asteroids are killed, which hands them back to their pools, so a
+        restart costs one pass over what was on screen and nothing left
+        over from earlier games is iterated again.
+
+        Args:
+            seed: Game seed; a random seed is picked when None
+        """
+        for sprite in self.asteroids.sprites() + self.shots.sprites():
+            sprite.kill()
+        if self.player is not None:
+            self.player.kill()
+        if self.pool_manager is not None:
+            self.pool_manager.recycle()
+        self.neighbor_index.clear()
+        self.spawn_plan.clear()
+
+        # Every random decision in the game comes from a sub-stream of this
+        self.rng = GameRNG(seed)
+        self.spawn_rng = self.rng.stream(GameRNG.SPAWNS)
+
+        self._assign_containers()
+        # Nothing is left alive, so this hands the stores back (unless the
+        # threshold is zero)
+        self.balance_stores()
+
+        self.player = Player(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, self.shots)
+        self.perk_manager = PerkManager(self.rng.stream(GameRNG.PERKS))
+
+        self.credits = 0
+        self.wave = 1
+        self.perks_available = []
+        self.ticks = 0
+        self.elite_kills = dict.fromkeys(ELITE_TYPES, 0)
+        self.wave_time = 0.0
+
+        # Start the first wave with interlude
+        self._start_countdown()
+
+    def step(self, dt, controls=None):
+        """Advance the game by one tick.
+
+        Args:
+            dt: Time elapsed since last tick (in seconds)
+            controls: InputState for this tick, or None for no input
+        """
+        if controls is None:
+            controls = InputState()
+        if self.recorder is not None:
+            self.recorder.record(controls)
+
+        if self.state == STATE_WAVE_TRANSITION:
+            self.countdown -= dt
+            if self.countdown <= 0:
+                # Wave countdown finished; the planned asteroids stream in
+                self.wave_time = 0.0
+                self.state = STATE_PLAYING
+
+        elif self.state == STATE_PERK_SELECTION:
+            if controls.perk_choice is not None and controls.perk_choice < len(self.perks_available):
+                self.select_perk(self.perks_available[controls.perk_choice])
+
+        # Update game objects if in playing state
+        if self.state == STATE_PLAYING:
+            self.player.controls = controls
+            profiler = self.profiler
+            if self.spawn_plan.remaining:
+                with profiler.scope("spawns"):
+                    self.release_wave(dt)
+            self.balance_stores()
+            with profiler.scope("update"):
+                self.update_entities(dt)
+            with profiler.scope("collisions"):
+                self.handle_collisions()
+
+            # Killed sprites become reusable once this tick is done with them
+            if self.pool_manager is not None:
+                self.pool_manager.recycle()
+
+            # Check if wave is complete
+            if not self.asteroids and not self.spawn_plan.remaining and self.state == STATE_PLAYING:
+                self._finish_wave()
+
+        self.ticks += 1
+
+    def balance_stores(self):
+        """Switch the component stores on or off to suit the entity count.
+
+        They take over at STORE_MIN_ENTITIES asteroids plus shots and hand
+        back below half that, so a count hovering around the threshold does
+        not move everything back and forth every tick.
+        """
+        entities = len(self.asteroids) + len(self.shots)
+        if self.stores:
+            if entities < STORE_MIN_ENTITIES // 2:
+                self.use_stores(False)
+        elif entities >= STORE_MIN_ENTITIES:
+            self.use_stores(True)
+
+    def use_stores(self, enabled):
+        """Move the live asteroids and shots into or out of the component stores.
+
+        Sprites keep their state either way. Only call this between ticks,
+        since the neighbor index is emptied until the next refresh.
+
+        Args:
+            enabled: True to use the available stores, False for plain groups
+        """
+        asteroid_store, shot_store = self.available_stores if enabled else (None, None)
+        moves = ((self.asteroids, self.asteroid_store, asteroid_store),
+                 (self.shots, self.shot_store, shot_store))
+        if all(old is new for _, old, new in moves):
+            return
+        for group, old, new in moves:
+            if old is new or not group:
+                continue
+            sprites = group.sprites()
+            (old if old is not None else self.updateables).remove(*sprites)
+            if new is not None:
+                with new.batch():
+                    new.add(*sprites)
+            else:
+                self.updateables.add(*sprites)
+
+        self.asteroid_store = asteroid_store
+        self.shot_store = shot_store
+        self.stores = tuple(store for store in (asteroid_store, shot_store) if store is not None)
+        self.collision_manager.asteroid_store = asteroid_store
+        self.collision_manager.shot_store = shot_store
+        self.swarm_manager.asteroid_store = asteroid_store
+        self.explosion_manager.asteroid_store = asteroid_store
+        self.neighbor_index.clear()
+        self._assign_containers()
+
+    def update_entities(self, dt):
+        """Move every entity one tick, without resolving collisions."""
+        for store in self.stores:
+            store.update(dt)
+        self.updateables.update(dt)
+        self.neighbor_index.refresh(self.asteroids, self.asteroid_store)
+        self.swarm_manager.update(dt)
+
+    def select_perk(self, perk):
+        """Apply the chosen perk and move on to the next wave's countdown."""
+        if self.state != STATE_PERK_SELECTION:
+            return
+        self.player.add_perk(perk)
+        if self.verbose:
+            print(f"Selected perk: {perk.name}")
+
+        self.perks_available = []
+        self._start_countdown()
+
+    def plan_wave(self, w):
+        """Decide wave w's asteroids now, to be created once it starts."""
+        self.spawn_plan.clear()
+        self.spawn_plan.plan(
+            self.spawn_rng, w * ASTEROID_KINDS,
+            # increase speed with wave
+            speed_bonus=(w - 1) * 10,
+            elite_chance=ELITE_SPAWN_CHANCE if w >= ELITE_MIN_WAVE else 0.0)
+
+    def spawn_wave(self, w):
+        """Spawn all of wave w's asteroids at the screen edges right away."""
+        self.plan_wave(w)
+        with self.spawn_batch():
+            self.spawn_plan.release()
+
+    def release_wave(self, dt):
+        """Create this tick's share of the planned wave.
+
+        The plan is spread evenly over the wave's first WAVE_SPAWN_TIME
+        seconds, with at most WAVE_SPAWN_BUDGET asteroids in one tick.
+
+        Args:
+            dt: Time elapsed since last tick (in seconds)
+        """
+        plan = self.spawn_plan
+        self.wave_time += dt
+        due = len(plan)
+        if self.wave_time < WAVE_SPAWN_TIME:
+            due = math.ceil(due * self.wave_time / WAVE_SPAWN_TIME)
+        count = min(due - plan.released, WAVE_SPAWN_BUDGET)
+        if count > 0:
+            with self.spawn_batch():
+                plan.release(count)
+
+    def _assign_containers(self):
+        # Entities register themselves into this game's groups on creation
+        # (elite subclasses inherit Asteroid's)
+        asteroid_updater = self.asteroid_store if self.asteroid_store is not None else self.updateables
+        shot_updater = self.shot_store if self.shot_store is not None else self.updateables
+
+        Player.containers = (self.updateables, self.drawables)
+        Asteroid.containers = (self.asteroids, asteroid_updater, self.drawables)
+        Shot.containers = (self.shots, shot_updater, self.drawables)
+
+        Asteroid.pools = self.pool_manager
+        EliteAsteroid.neighbor_index = self.neighbor_index
+        Shot.pools = self.pool_manager
+
+        # Plain splits and elite behaviours draw from separate streams
+        Asteroid.rng = self.rng.stream(GameRNG.ASTEROIDS)
+        EliteAsteroid.rng = self.rng.stream(GameRNG.ELITES)
+        if self.asteroid_store is not None:
+            # Batched elite behaviours draw whole arrays at a time
+            self.asteroid_store.rng = self.rng.generator(GameRNG.ELITE_BEHAVIOURS)
+
+    def handle_collisions(self):
+        """Resolve this tick's player and shot collisions."""
+        player = self.player
+        detonated = []
+        player_hits, destroyed = self.collision_manager.resolve(player)
+        for asteroid in player_hits:
+            # asteroid hits player
+            asteroid.kill()
+            player.hp -= 1
+            if player.hp <= 0 and self.state != STATE_GAME_OVER:
+                if self.verbose:
+                    print("Game over! Final credits:", self.credits)
+                self.state = STATE_GAME_OVER
+
+        # Fragments from every split this tick join the asteroid store together
+        with self.spawn_batch():
+            # Shots have been used up and damage dealt; split what they destroyed
+            start = time.perf_counter()
+            for asteroid in destroyed:
+                self._destroy(asteroid)
+                if isinstance(asteroid, ExploderAsteroid) and asteroid.explosion_primed:
+                    detonated.append(asteroid)
+            split_time = time.perf_counter() - start
+
+            # Chain reactions are resolved after the shots, all in this tick
+            if detonated:
+                with self.profiler.scope("explosions"):
+                    self.detonate(detonated)
+
+        # Splitting is timed inside the collision pass, once per tick
+        self.profiler.record("splits", split_time)
+
+    def detonate(self, exploders):
+        """Set off primed exploders and destroy whatever their blasts finish.
+
+        Args:
+            exploders: Primed exploders that were just destroyed
+        """
+        for asteroid in self.explosion_manager.resolve(exploders):
+            self._destroy(asteroid)
+
+    def spawn_batch(self):
+        """Return a context in which new asteroids join the store together."""
+        if self.asteroid_store is None:
+            return contextlib.nullcontext()
+        return self.asteroid_store.batch()
+
+    def _destroy(self, asteroid):
+        """Credit a destroyed asteroid and split it."""
+        # Add credits based on asteroid type
+        self.credits += asteroid.credits_value
+        if isinstance(asteroid, EliteAsteroid):
+            self.elite_kills[asteroid.elite_type] = self.elite_kills.get(asteroid.elite_type, 0) + 1
+
+        # Elite asteroids may have special splitting behavior. Children join
+        # the asteroid groups through their containers as they are created.
+        asteroid.split()
+
+    def _start_countdown(self):
+        # The countdown leaves time to plan the wave before it has to spawn
+        self.state = STATE_WAVE_TRANSITION
+        self.countdown = WAVE_COUNTDOWN
+        self.plan_wave(self.wave)
+
+    def _finish_wave(self):
+        self.wave += 1
+        # Go to perk selection if enabled
+        if PERK_SELECTION_AFTER_WAVE:
+            self.perks_available = self.perk_manager.get_random_perks(3)
+            self.state = STATE_PERK_SELECTION
+        else:
+            # Go directly to next wave
+            self._start_countdown()
@@ -0,0 +1,115 @@
+"""Run the game logic without a window, as fast as the CPU allows.
+
+Usage:
+    python -m src.headless --ticks 20000
+    python -m src.headless --replay session.bkr
+"""
+import argparse
+import os
+import time
+
+# No window is ever opened, but make sure SDL never tries to find a display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from src.constants import SIMULATION_RATE, STATE_GAME_OVER  # noqa: E402
+from src.game import GameSimulation  # noqa: E402
+from src.utils.input_source import RandomInput  # noqa: E402
+from src.utils.replay import ReplayInput, ReplayWriter  # noqa: E402
+from src.utils.rng import GameRNG  # noqa: E402
+
+HEADLESS_DT = 1 / SIMULATION_RATE
+HEADLESS_TICKS = 20000  # Default length of a random run
+
+
+def run_headless(max_ticks, input_source=None, dt=HEADLESS_DT, simulation=None):
+    """Step a game until it ends or max_ticks have run.
+
+    Args:
+        max_ticks: Upper bound on the number of ticks to simulate
+        input_source: Object with poll(events) returning an InputState;
+            defaults to RandomInput on the game's input stream
+        dt: Simulated seconds per tick
+        simulation: Existing GameSimulation to continue; a quiet new one
+            is created by default
+
+    Returns:
+        dict: Outcome of the run plus ticks and ticks_per_second
+    """
+    if simulation is None:
+        simulation = GameSimulation(verbose=False)
+    if input_source is None:
+        input_source = RandomInput(rng=simulation.rng.stream(GameRNG.INPUT))
+
+    start = time.perf_counter()
+    while simulation.ticks < max_ticks and simulation.state != STATE_GAME_OVER:
+        simulation.step(dt, input_source.poll(()))
+    return _result(simulation, time.perf_counter() - start)
+
+
+def replay_game(path, max_ticks=None):
+    """Re-run a recorded game from its replay file.
+
+    Args:
+        path: Replay file written by ReplayWriter
+        max_ticks: Optional limit, to stop before the end of the recording
+
+    Returns:
+        dict: Same fields as run_headless
+    """
+    replay = ReplayInput(path)
+    simulation = GameSimulation(seed=replay.seed, verbose=False)
+
+    start = time.perf_counter()
+    while replay.has_next() and simulation.state != STATE_GAME_OVER:
+        if max_ticks is not None and simulation.ticks >= max_ticks:
+            break
+        simulation.step(replay.dt, replay.poll())
+    replay.close()
+    return _result(simulation, time.perf_counter() - start)
+
+
+def _result(simulation, elapsed):
+    return {
+        "ticks": simulation.ticks,
+        "seconds": elapsed,
+        "ticks_per_second": simulation.ticks / elapsed if elapsed > 0 else 0.0,
+        "seed": simulation.rng.seed,
+        "wave": simulation.wave,
+        "credits": simulation.credits,
+        "game_over": simulation.state == STATE_GAME_OVER,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the game without a display.")
+    parser.add_argument("--ticks", type=int, default=None,
+                        help=f"maximum number of ticks to simulate (default {HEADLESS_TICKS}, "
+                             "or the whole recording with --replay)")
+    parser.add_argument("--dt", type=float, default=HEADLESS_DT,
+                        help="simulated seconds per tick")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="game seed (random when omitted)")
+    parser.add_argument("--record", metavar="PATH", default=None,
+                        help="record the run's input to a replay file")
+    parser.add_argument("--replay", metavar="PATH", default=None,
+                        help="re-run a recorded game instead of a random one")
+    args = parser.parse_args()
+
+    if args.replay:
+        result = replay_game(args.replay, args.ticks)
+    else:
+        simulation = GameSimulation(seed=args.seed, verbose=False)
+        if args.record:
+            simulation.recorder = ReplayWriter(args.record, simulation.rng.seed, args.dt)
+        max_ticks = HEADLESS_TICKS if args.ticks is None else args.ticks
+        result = run_headless(max_ticks, dt=args.dt, simulation=simulation)
+        if simulation.recorder is not None:
+            simulation.recorder.close()
+    print(f"Simulated {result['ticks']} ticks in {result['seconds']:.2f}s "
+          f"({result['ticks_per_second']:.0f} ticks/s)")
+    print(f"Seed {result['seed']}: reached wave {result['wave']} with {result['credits']} credits"
+          f"{' (game over)' if result['game_over'] else ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-import random
+from array import array
 
 import pygame
 
@@ -6,60 +6,120 @@ from src.constants import (
     ASTEROID_MAX_RADIUS,
     ASTEROID_MIN_RADIUS,
     ASTEROID_KINDS,
-    ASTEROID_SPAWN_RATE,
+    ELITE_TYPES,
     SCREEN_WIDTH,
     SCREEN_HEIGHT
 )
 from src.entities.asteroid import Asteroid
+from src.entities.elite_asteroid import create_elite_asteroid
 
 
-class AsteroidField(pygame.sprite.Sprite):
-    edges = [
-        [
-            pygame.Vector2(1, 0),
-            lambda y: pygame.Vector2(
-                -ASTEROID_MAX_RADIUS, y * SCREEN_HEIGHT
-            ),
-        ],
-        [
-            pygame.Vector2(-1, 0),
-            lambda y: pygame.Vector2(
-                SCREEN_WIDTH + ASTEROID_MAX_RADIUS,
-                y * SCREEN_HEIGHT,
-            ),
-        ],
-        [
-            pygame.Vector2(0, 1),
-            lambda x: pygame.Vector2(
-                x * SCREEN_WIDTH, -ASTEROID_MAX_RADIUS
-            ),
-        ],
-        [
-            pygame.Vector2(0, -1),
-            lambda x: pygame.Vector2(
-                x * SCREEN_WIDTH,
-                SCREEN_HEIGHT + ASTEROID_MAX_RADIUS,
-            ),
-        ],
-    ]
+# Screen edges asteroids enter from: inward direction, and the entry point
+# for a 0-1 position along the edge
+EDGES = [
+    [
+        pygame.Vector2(1, 0),
+        lambda y: pygame.Vector2(
+            -ASTEROID_MAX_RADIUS, y * SCREEN_HEIGHT
+        ),
+    ],
+    [
+        pygame.Vector2(-1, 0),
+        lambda y: pygame.Vector2(
+            SCREEN_WIDTH + ASTEROID_MAX_RADIUS,
+            y * SCREEN_HEIGHT,
+        ),
+    ],
+    [
+        pygame.Vector2(0, 1),
+        lambda x: pygame.Vector2(
+            x * SCREEN_WIDTH, -ASTEROID_MAX_RADIUS
+        ),
+    ],
+    [
+        pygame.Vector2(0, -1),
+        lambda x: pygame.Vector2(
+            x * SCREEN_WIDTH,
+            SCREEN_HEIGHT + ASTEROID_MAX_RADIUS,
+        ),
+    ],
+]
+
+
+class SpawnPlan:
+    """Asteroids decided on ahead of time and created later, a few at a time.
+
+    Each planned asteroid is one entry across compact parallel arrays:
+    the screen edge it enters from, where along that edge, its speed, its
+    turn away from straight in, its kind and its elite type (an index into
+    ELITE_TYPES, or -1 for a plain asteroid). Planning only draws random
+    numbers, so it can be done while nothing else is going on; release()
+    then turns entries into sprites in plan order.
+    """
 
     def __init__(self):
-        pygame.sprite.Sprite.__init__(self, self.containers)
-        self.spawn_timer = 0.0
+        self.edges = array("b")
+        self.offsets = array("d")
+        self.speeds = array("i")
+        self.angles = array("h")
+        self.kinds = array("b")
+        self.elite_types = array("b")
+        self.released = 0  # Entries already turned into asteroids
+
+    def __len__(self):
+        return len(self.kinds)
+
+    @property
+    def remaining(self):
+        """Number of planned asteroids not created yet."""
+        return len(self.kinds) - self.released
+
+    def clear(self):
+        """Drop every entry, released or not."""
+        for column in (self.edges, self.offsets, self.speeds, self.angles, self.kinds, self.elite_types):
+            del column[:]
+        self.released = 0
+
+    def plan(self, rng, count, speed_bonus=0, elite_chance=0.0):
+        """Append count asteroids entering from random edges.
 
-    def spawn(self, radius, position, velocity):
-        asteroid = Asteroid(position.x, position.y, radius)
-        asteroid.velocity = velocity
+        Args:
+            rng: random.Random to draw from
+            count: Number of asteroids to plan
+            speed_bonus: Added to every asteroid's random speed
+            elite_chance: Chance of each asteroid being an elite
+        """
+        for _ in range(count):
+            self.edges.append(rng.randrange(len(EDGES)))
+            self.speeds.append(rng.randint(40, 100) + speed_bonus)
+            self.angles.append(rng.randint(-30, 30))
+            self.offsets.append(rng.uniform(0, 1))
+            self.kinds.append(rng.randint(1, ASTEROID_KINDS))
+            if elite_chance and rng.random() < elite_chance:
+                self.elite_types.append(rng.randrange(len(ELITE_TYPES)))
+            else:
+                self.elite_types.append(-1)
 
-    def update(self, dt):
-        self.spawn_timer += dt
-        if self.spawn_timer > ASTEROID_SPAWN_RATE:
-            self.spawn_timer = 0
+    def release(self, count=None):
+        """Create the next count planned asteroids (all remaining when None).
 
-            edge = random.choice(self.edges)
-            speed = random.randint(40, 100)
-            velocity = edge[0] * speed
-            velocity = velocity.rotate(random.randint(-30, 30))
-            position = edge[1](random.uniform(0, 1))
-            kind = random.randint(1, ASTEROID_KINDS)
-            self.spawn(ASTEROID_MIN_RADIUS * kind, position, velocity)
\ No newline at end of file
+        Returns:
+            int: Number of asteroids created
+        """
+        start = self.released
+        stop = len(self.kinds) if count is None else min(len(self.kinds), start + count)
+        for i in range(start, stop):
+            direction, place = EDGES[self.edges[i]]
+            position = place(self.offsets[i])
+            radius = ASTEROID_MIN_RADIUS * self.kinds[i]
+            elite_type = self.elite_types[i]
+            if elite_type < 0:
+                asteroid = Asteroid.acquire(position.x, position.y, radius)
+            else:
+                asteroid = create_elite_asteroid(position.x, position.y, radius, ELITE_TYPES[elite_type])
+            asteroid.velocity = (direction * self.speeds[i]).rotate(self.angles[i])
+        self.released = stop
+        if stop == len(self.kinds):
+            # Everything is out; start the arrays over rather than grow them
+            self.clear()
+        return stop - start
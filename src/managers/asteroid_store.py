@@ -0,0 +1,173 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; without it asteroids update themselves
+    np = None
+
+from src.constants import (
+    EXPLODER_PRIME_CHANCE,
+    EXPLODER_PRIME_HEALTH,
+    SHIELD_HIT_DAMAGE,
+    SWARM_LEADER_TURN_ANGLE,
+    SWARM_LEADER_TURN_CHANCE,
+)
+from src.entities.asteroid import Asteroid
+from src.entities.elite_asteroid import (
+    EliteAsteroid,
+    ExploderAsteroid,
+    ShieldedAsteroid,
+    SwarmLeaderAsteroid,
+    angular_offset,
+)
+from src.managers.component_store import ComponentStore, StoredComponents, ScalarField
+
+# Type tags stored per slot so passes can select asteroids by kind
+TYPE_PLAIN = 0
+TYPE_ELITE = 1
+TYPE_EXPLODER = 2
+TYPE_SHIELDED = 3
+TYPE_SWARM_LEADER = 4
+
+TYPE_TAGS = {
+    Asteroid: TYPE_PLAIN,
+    EliteAsteroid: TYPE_ELITE,
+    ExploderAsteroid: TYPE_EXPLODER,
+    ShieldedAsteroid: TYPE_SHIELDED,
+    SwarmLeaderAsteroid: TYPE_SWARM_LEADER,
+}
+
+
+def type_tag_for(cls):
+    """Return the type tag of the closest known asteroid class in cls's MRO."""
+    for base in cls.__mro__:
+        if base in TYPE_TAGS:
+            return TYPE_TAGS[base]
+    return TYPE_PLAIN
+
+
+class StoredAsteroid(StoredComponents):
+    """Component proxy for asteroids: adds health to the shared components.
+
+    While an asteroid is in an AsteroidStore, position, velocity, radius and
+    health read and write the store's arrays, so draw, take_damage and split
+    keep working unchanged.
+    """
+
+    health = ScalarField("health")
+
+    def update(self, dt):
+        """Motion and elite behaviours are stepped by the owning store."""
+
+
+class StoredElite(StoredAsteroid):
+    """Elite behaviour component: how long the elite has been alive."""
+
+    time_alive = ScalarField("time_alive")
+
+
+class StoredExploder(StoredElite):
+    explosion_primed = ScalarField("primed", dtype=bool)
+
+
+class StoredShielded(StoredElite):
+    shield_angle = ScalarField("shield_angles")
+    shield_arc_width = ScalarField("shield_arcs")
+    rotation_speed = ScalarField("shield_speeds")
+
+
+class AsteroidStore(ComponentStore):
+    """Component store for asteroids.
+
+    Use it in place of the updateables group in the asteroid containers.
+    On top of the shared components every slot has health and a type tag,
+    and elites keep their behaviour state (time alive, priming, shield
+    angle and speed) in arrays too. update() moves and wraps every asteroid
+    in a single vectorized step, then runs each elite kind's behaviour as
+    one batch over that kind's slots instead of calling special_behavior()
+    per asteroid.
+    """
+
+    proxy_mixin = StoredAsteroid
+    kind_mixins = {
+        EliteAsteroid: StoredElite,
+        ExploderAsteroid: StoredExploder,
+        ShieldedAsteroid: StoredShielded,
+    }
+    tags = (("type_tags", "int8"),)
+    # NumPy Generator for the batched behaviours' random draws; the game
+    # assigns one seeded from its own seed
+    rng = None
+
+    def tag_values(self, sprite):
+        return (type_tag_for(type(sprite)),)
+
+    def update(self, dt):
+        """Move and wrap all asteroids, then run the batched elite behaviours.
+
+        Args:
+            dt: Time elapsed since last update (in seconds)
+        """
+        count = self.count
+        if not count:
+            return
+        self.move(dt)
+
+        type_tags = self.type_tags[:count]
+        elites = type_tags != TYPE_PLAIN
+        if not elites.any():
+            return
+        if self.rng is None:
+            self.rng = np.random.default_rng()
+
+        time_alive = self.time_alive[:count]
+        time_alive[elites] += dt
+        self._prime_exploders(np.flatnonzero(type_tags == TYPE_EXPLODER))
+        self._turn_shields(np.flatnonzero(type_tags == TYPE_SHIELDED), dt)
+        self._turn_swarm_leaders(np.flatnonzero(type_tags == TYPE_SWARM_LEADER))
+
+    def hit_damage(self, slots, attack_angles):
+        """Return the damage take_damage(angle) would deal for each of a batch of hits.
+
+        Exploders are not covered, since their hits can also prime them.
+
+        Args:
+            slots: Slot of the asteroid each hit lands on
+            attack_angles: Direction each hit comes from, in degrees
+        """
+        damage = np.ones(len(slots))
+        shielded = np.flatnonzero(self.type_tags[slots] == TYPE_SHIELDED)
+        if len(shielded):
+            shield_slots = slots[shielded]
+            offsets = angular_offset(attack_angles[shielded], self.shield_angles[shield_slots])
+            blocked = np.abs(offsets) <= self.shield_arcs[shield_slots] / 2
+            damage[shielded[blocked]] = SHIELD_HIT_DAMAGE
+        return damage
+
+    def _prime_exploders(self, slots):
+        # ExploderAsteroid.special_behavior for every exploder at once
+        waiting = slots[(self.health[slots] <= EXPLODER_PRIME_HEALTH) & ~self.primed[slots]]
+        if len(waiting):
+            self.primed[waiting[self.rng.random(len(waiting)) < EXPLODER_PRIME_CHANCE]] = True
+
+    def _turn_shields(self, slots, dt):
+        # ShieldedAsteroid.special_behavior for every shielded asteroid at once
+        if len(slots):
+            angles = self.shield_angles[slots] + self.shield_speeds[slots] * dt
+            self.shield_angles[slots] = angles % 360
+
+    def _turn_swarm_leaders(self, slots):
+        # SwarmLeaderAsteroid.special_behavior: one draw per leader decides
+        # which of them turn this tick
+        if not len(slots):
+            return
+        turning = slots[self.rng.random(len(slots)) < SWARM_LEADER_TURN_CHANCE]
+        if not len(turning):
+            return
+        angles = np.radians(self.rng.choice((-SWARM_LEADER_TURN_ANGLE, SWARM_LEADER_TURN_ANGLE),
+                                            len(turning)))
+        cos = np.cos(angles)
+        sin = np.sin(angles)
+        velocities = self.velocities[turning]
+        self.velocities[turning] = np.column_stack((
+            velocities[:, 0] * cos - velocities[:, 1] * sin,
+            velocities[:, 0] * sin + velocities[:, 1] * cos,
+        ))
@@ -0,0 +1,240 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; hits are then settled one by one
+    np = None
+
+from src.managers.asteroid_store import TYPE_EXPLODER
+from src.utils import batch_collision
+from src.utils.spatial_hash import SpatialHash
+from src.utils.topology import WORLD
+
+
+class CollisionManager:
+    """Finds player and shot hits against asteroids once per frame.
+
+    A spatial hash of the shots limits the circle checks to shots near
+    each asteroid. With NumPy available the grid is built from position
+    arrays (taken straight from the asteroid and shot stores when there are
+    any) and the candidate pairs are tested in one vectorized pass; with
+    few enough pairs they are simply all tested. Without NumPy, or for a
+    handful of shapes outside the stores, the shots are bucketed and
+    checked pair by pair. Both paths measure distances the short way round
+    the wrapping world, so shapes touch across the screen edges.
+    """
+
+    # Below this many asteroid/shot pairs testing them all beats building
+    # the grid (crossover measured with the collisions.check benchmark)
+    grid_min_pairs = 5000
+    # Below this many, and without stores, array setup costs more than the
+    # Python grid saves
+    batch_min_pairs = 256
+
+    def __init__(self, asteroids, shots, asteroid_store=None, topology=WORLD, shot_store=None):
+        """Create a collision manager.
+
+        Args:
+            asteroids: Sprite group of all asteroids
+            shots: Sprite group of all live shots
+            asteroid_store: Optional AsteroidStore holding the same asteroids
+            topology: WorldTopology the shapes wrap in
+            shot_store: Optional ShotStore holding the same shots
+        """
+        self.asteroids = asteroids
+        self.shots = shots
+        self.asteroid_store = asteroid_store
+        self.topology = topology
+        self.shot_store = shot_store
+        self.use_batch = batch_collision.available
+        self.shot_grid = SpatialHash(topology=topology)
+
+    def check(self, player):
+        """Find this frame's collisions.
+
+        Args:
+            player: The Player to test asteroids against
+
+        Returns:
+            tuple: (player_hits, shot_hits) where player_hits lists asteroids
+            touching the player and shot_hits yields (asteroid, shot,
+            attack_angle) for overlapping pairs, asteroid by asteroid and
+            then in shot order. Shot hits ignore pierce, so callers
+            should skip shots that are no longer alive and call
+            shot.register_hit() for the rest.
+        """
+        if self.use_batch and (self.asteroid_store is not None or
+                               len(self.asteroids) * len(self.shots) >= self.batch_min_pairs):
+            player_hits, (asteroid_list, shot_list, asteroid_rows, shot_rows, angles) = \
+                self._find_batch(player)
+            shot_hits = [
+                (asteroid_list[asteroid_row], shot_list[shot_row], angle)
+                for asteroid_row, shot_row, angle in zip(
+                    asteroid_rows.tolist(), shot_rows.tolist(), angles.tolist())
+            ]
+            return player_hits, shot_hits
+        return self._check_grid(player)
+
+    def resolve(self, player):
+        """Find this frame's collisions and settle the shot hits.
+
+        Walking the hits in check() order, every hit uses up one pierce of
+        its shot (or the shot itself) and calls take_damage(attack_angle)
+        on its asteroid; hits from used-up shots are dropped. With NumPy and
+        an asteroid store this is done for all hits in a few array passes.
+        Asteroids are neither killed nor split here.
+
+        Args:
+            player: The Player to test asteroids against
+
+        Returns:
+            tuple: (player_hits, destroyed) where player_hits lists asteroids
+            touching the player and destroyed lists the asteroids shots took
+            to zero health, once each, in hit order
+        """
+        if self.use_batch and self.asteroid_store is not None:
+            player_hits, (asteroid_list, shot_list, asteroid_rows, shot_rows, angles) = \
+                self._find_batch(player)
+            if not len(shot_rows):
+                return player_hits, []
+            landed = self._use_shots(shot_list, shot_rows)
+            return player_hits, self._damage_asteroids(asteroid_list, asteroid_rows[landed], angles[landed])
+
+        player_hits, shot_hits = self.check(player)
+        destroyed = {}
+        for asteroid, shot, attack_angle in shot_hits:
+            if not shot.alive():
+                # Already used up on an earlier hit this tick
+                continue
+            shot.register_hit()
+            if asteroid.take_damage(attack_angle):
+                destroyed[asteroid] = None
+        return player_hits, list(destroyed)
+
+    def _find_batch(self, player):
+        asteroid_list, asteroid_positions, asteroid_radii = self._asteroid_arrays()
+        shot_list, shot_positions, shot_radii = self._shot_arrays()
+        player_positions, player_radii = batch_collision.shape_arrays([player])
+
+        player_rows, _ = batch_collision.circle_hits(
+            player_positions, player_radii, asteroid_positions, asteroid_radii,
+            self.topology)
+        player_hits = [asteroid_list[row] for row in player_rows.tolist()]
+
+        if len(asteroid_list) * len(shot_list) < self.grid_min_pairs:
+            asteroid_rows, shot_rows = batch_collision.circle_hits(
+                shot_positions, shot_radii, asteroid_positions, asteroid_radii,
+                self.topology)
+        else:
+            # The shot grid narrows the asteroid/shot pairs down to
+            # neighbours before the circle test
+            grid = self.shot_grid
+            grid.rebuild_arrays(shot_positions, shot_radii)
+            asteroid_rows, shot_rows = grid.candidates(asteroid_positions, asteroid_radii)
+            asteroid_rows, shot_rows = batch_collision.pair_hits(
+                shot_positions, shot_radii, asteroid_positions, asteroid_radii,
+                asteroid_rows, shot_rows, self.topology)
+        angles = batch_collision.attack_angles(
+            shot_positions[shot_rows], asteroid_positions[asteroid_rows], self.topology)
+        return player_hits, (asteroid_list, shot_list, asteroid_rows, shot_rows, angles)
+
+    def _use_shots(self, shot_list, shot_rows):
+        """Shot.register_hit for every hit at once.
+
+        A shot lands its first pierce + 1 hits; the rest are dropped.
+
+        Returns:
+            ndarray: Mask of the hits that landed
+        """
+        store = self.shot_store
+        if store is not None:
+            pierce = store.pierce[:store.count].copy()
+        else:
+            pierce = np.array([shot.pierce for shot in shot_list], dtype=int)
+
+        used = np.bincount(shot_rows, minlength=len(shot_list))
+        if (used <= pierce + 1).all():
+            # No shot ran out part way, so every hit landed
+            landed = np.ones(len(shot_rows), dtype=bool)
+        else:
+            # Rank each hit among its shot's hits, keeping hit order within a shot
+            order = np.argsort(shot_rows, kind="stable")
+            sorted_rows = shot_rows[order]
+            firsts = np.flatnonzero(np.r_[True, sorted_rows[1:] != sorted_rows[:-1]])
+            rank = np.arange(len(order)) - np.repeat(firsts, np.diff(np.r_[firsts, len(order)]))
+            landed = np.empty(len(order), dtype=bool)
+            landed[order] = rank <= pierce[sorted_rows]
+            used = np.bincount(shot_rows[landed], minlength=len(shot_list))
+
+        # Landed hits use up pierce; a hit with none left uses up the shot
+        hit = np.flatnonzero(used)
+        spent = used[hit] > pierce[hit]
+        pierced = np.minimum(used[hit], pierce[hit])
+        if store is not None:
+            store.pierce[hit] -= pierced
+        else:
+            for row, count in zip(hit.tolist(), pierced.tolist()):
+                shot_list[row].pierce -= count
+        # Look the shots up first; each kill moves the last slot
+        for shot in [shot_list[row] for row in hit[spent].tolist()]:
+            shot.kill()
+        return landed
+
+    def _damage_asteroids(self, asteroid_list, rows, angles):
+        """take_damage for every landed hit; rows are asteroid store slots."""
+        store = self.asteroid_store
+        exploding = store.type_tags[rows] == TYPE_EXPLODER
+
+        # Everything but exploders only loses health, so hits are summed
+        steady = rows[~exploding]
+        damage = np.bincount(
+            steady, weights=store.hit_damage(steady, angles[~exploding]), minlength=len(asteroid_list))
+        hit = np.flatnonzero(damage)
+        health = store.health[:len(asteroid_list)]
+        health[hit] -= damage[hit]
+        destroyed = set(hit[health[hit] <= 0].tolist())
+
+        # Exploders may prime on each hit, so they take theirs one by one
+        if exploding.any():
+            for row, angle in zip(rows[exploding].tolist(), angles[exploding].tolist()):
+                if asteroid_list[row].take_damage(angle):
+                    destroyed.add(row)
+        return [asteroid_list[row] for row in sorted(destroyed)]
+
+    def _asteroid_arrays(self):
+        store = self.asteroid_store
+        if store is None:
+            asteroid_list = self.asteroids.sprites()
+            positions, radii = batch_collision.shape_arrays(asteroid_list)
+            return asteroid_list, positions, radii
+
+        # Copy, since kills during hit handling reshuffle the store's slots
+        count = store.count
+        return (list(store.slots), store.positions[:count].copy(),
+                store.radii[:count].copy())
+
+    def _shot_arrays(self):
+        store = self.shot_store
+        if store is None:
+            shot_list = self.shots.sprites()
+            positions, radii = batch_collision.shape_arrays(shot_list)
+            return shot_list, positions, radii
+
+        # Views are enough: no shot is killed until the hits are returned
+        count = store.count
+        return list(store.slots), store.positions[:count], store.radii[:count]
+
+    def _check_grid(self, player):
+        asteroid_list = self.asteroids.sprites()
+        player_hits = [asteroid for asteroid in asteroid_list
+                       if player.collision_check(asteroid)]
+        self.shot_grid.rebuild(self.shots)
+        return player_hits, self._grid_shot_hits(asteroid_list)
+
+    def _grid_shot_hits(self, asteroid_list):
+        # Lazy, so the circle checks see shots killed by earlier hits
+        overlaps = self.topology.overlaps
+        for asteroid in asteroid_list:
+            for shot in self.shot_grid.query(asteroid.position, asteroid.radius):
+                if not shot.alive():
+                    continue
+                if overlaps(shot.position, shot.radius, asteroid.position, asteroid.radius):
+                    yield asteroid, shot, shot.get_attack_angle(asteroid.position)
@@ -0,0 +1,417 @@
+from collections import namedtuple
+from contextlib import contextmanager
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; without it sprites update themselves
+    np = None
+
+from src.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+
+# Stable reference to a stored entity. The generation changes whenever the
+# entity index is freed, so a handle to a destroyed entity never resolves
+# to whatever reuses its index.
+EntityHandle = namedtuple("EntityHandle", "index generation")
+
+
+class VectorField:
+    """Expose one row of a store array as a pygame.Vector2 attribute."""
+
+    vector = True
+    dtype = float
+
+    def __init__(self, array_name):
+        self.array_name = array_name
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, sprite, owner=None):
+        if sprite is None:
+            return self
+        array = getattr(sprite._store, self.array_name)
+        slot = sprite._slot
+        return pygame.Vector2(array.item(slot, 0), array.item(slot, 1))
+
+    def __set__(self, sprite, value):
+        array = getattr(sprite._store, self.array_name)
+        slot = sprite._slot
+        array[slot, 0] = value[0]
+        array[slot, 1] = value[1]
+
+
+class ScalarField:
+    """Expose one element of a store array as a Python scalar attribute.
+
+    The array's dtype decides the type: float by default, bool for flags.
+    """
+
+    vector = False
+
+    def __init__(self, array_name, dtype=float):
+        self.array_name = array_name
+        self.dtype = dtype
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, sprite, owner=None):
+        if sprite is None:
+            return self
+        return getattr(sprite._store, self.array_name).item(sprite._slot)
+
+    def __set__(self, sprite, value):
+        getattr(sprite._store, self.array_name)[sprite._slot] = value
+
+
+class StoredComponents:
+    """Mixin that turns a sprite into a thin proxy over store arrays.
+
+    The store swaps a sprite's class to a subclass of its proxy mixin while
+    the sprite is a member, so the mixin's fields read and write the store's
+    component arrays while the sprite's own methods keep working unchanged.
+    Reading a vector field returns a fresh Vector2, so changes must be
+    assigned back rather than made in place.
+    """
+
+    position = VectorField("positions")
+    previous_position = VectorField("previous_positions")
+    velocity = VectorField("velocities")
+    radius = ScalarField("radii")
+
+    @classmethod
+    def fields(cls):
+        """Return the component fields of this mixin, in a fixed order."""
+        found = {}
+        for base in reversed(cls.__mro__):
+            for name, value in vars(base).items():
+                if isinstance(value, (VectorField, ScalarField)):
+                    found[name] = value
+        return tuple(found.values())
+
+    def update(self, dt):
+        """Stored sprites are stepped by the owning store's systems."""
+
+    def render_position(self, alpha):
+        """CircleShape.render_position, reading both rows in one go."""
+        store = self._store
+        x, y = store.positions[self._slot].tolist()
+        if alpha < 1:
+            previous_x, previous_y = store.previous_positions[self._slot].tolist()
+            # Don't interpolate across a screen wrap
+            if abs(x - previous_x) <= store.width / 2 and abs(y - previous_y) <= store.height / 2:
+                x = previous_x + (x - previous_x) * alpha
+                y = previous_y + (y - previous_y) * alpha
+        return pygame.Vector2(x, y)
+
+
+class ComponentStore(pygame.sprite.Group):
+    """Sprite group that keeps its members' components in dense NumPy arrays.
+
+    Each member owns one slot in every component array, plus any tag
+    arrays. The components come from the store's proxy mixin (position,
+    previous position, velocity and radius at least) and from kind_mixins,
+    which add components to some sprite classes only; other members simply
+    leave those slots unused. Slots stay packed: a leaving member's slot is
+    filled with the last one. Systems such as move() therefore walk
+    contiguous arrays and touch only this store's entities.
+
+    Members also get an entity index that survives slot moves. handle()
+    and resolve() turn it into a generation-checked EntityHandle that can
+    be kept across ticks.
+    """
+
+    available = np is not None
+    proxy_mixin = StoredComponents
+    # Sprite base class -> subclass of proxy_mixin adding that kind's components
+    kind_mixins = {}
+    # Extra per-slot arrays that are not sprite attributes: (name, dtype)
+    tags = ()
+
+    def __init__(self, capacity=256, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        """Create an empty store.
+
+        Args:
+            capacity: Initial number of slots; the arrays double when full
+            width: Width of the wrapping world
+            height: Height of the wrapping world
+        """
+        if np is None:
+            raise RuntimeError(f"{type(self).__name__} requires NumPy")
+        super().__init__()
+        self.width = width
+        self.height = height
+        self.count = 0
+        self.slots = []
+
+        fields = {}
+        for mixin in (self.proxy_mixin, *self.kind_mixins.values()):
+            for field in mixin.fields():
+                fields.setdefault(field.array_name, field)
+        self.fields = tuple(fields.values())
+        for field in self.fields:
+            shape = (capacity, 2) if field.vector else capacity
+            setattr(self, field.array_name, np.zeros(shape, dtype=field.dtype))
+        for name, dtype in self.tags:
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+        self.array_names = [field.array_name for field in self.fields] + [name for name, _ in self.tags]
+        self.arrays = [getattr(self, name) for name in self.array_names]  # Same order, rebuilt by _grow()
+        self.layouts = {}  # Proxy class -> (attribute, is vector, array index) per component
+        self.pending = None  # Sprites waiting for a slot inside batch()
+
+        # Entity index -> generation and slot (-1 while free)
+        self.generations = []
+        self.entity_slots = []
+        self.free_entities = []
+
+    def handle(self, sprite):
+        """Return a generation-checked handle to a member."""
+        index = sprite._entity
+        return EntityHandle(index, self.generations[index])
+
+    def resolve(self, handle):
+        """Return the member a handle refers to, or None once it has left."""
+        index, generation = handle
+        if index >= len(self.generations) or self.generations[index] != generation:
+            return None
+        return self.slots[self.entity_slots[index]]
+
+    def tag_values(self, sprite):
+        """Return the values of the tag arrays for a joining sprite."""
+        return ()
+
+    @contextmanager
+    def batch(self):
+        """Give sprites that join inside the block their slots together.
+
+        Joining sprites become members straight away but keep their own
+        attributes until the block ends; their slots are then filled in one
+        array write. Array passes (update, render_positions, collision
+        arrays) must not run inside the block.
+        """
+        if self.pending is not None:
+            yield
+            return
+        self.pending = []
+        try:
+            yield
+        finally:
+            pending = self.pending
+            self.pending = None
+            self._add_batch(pending)
+
+    def add_internal(self, sprite, layer=None):
+        """Give a joining sprite a slot and make it a proxy over it."""
+        super().add_internal(sprite, layer)
+        if self.pending is not None:
+            self.pending.append(sprite)
+            return
+        if self.count == len(self.radii):
+            self._grow()
+
+        slot = self.count
+        self.count += 1
+        self.slots.append(sprite)
+        proxy = self.proxy_class(type(sprite))
+
+        # Sprites join during CircleShape.__init__, before their attributes
+        # exist, so missing components start out as zero
+        state = sprite.__dict__
+        arrays = self.arrays
+        for name, vector, index in self._layout(proxy):
+            array = arrays[index]
+            if vector:
+                x, y = state.pop(name, (0, 0))
+                array[slot, 0] = x
+                array[slot, 1] = y
+            else:
+                array[slot] = state.pop(name, 0)
+        for (name, _), value in zip(self.tags, self.tag_values(sprite)):
+            getattr(self, name)[slot] = value
+
+        sprite._store = self
+        sprite._slot = slot
+        sprite._entity = self._new_entity(slot)
+        sprite.__class__ = proxy
+
+    def remove_internal(self, sprite):
+        """Copy a leaving sprite's state back and free its slot."""
+        super().remove_internal(sprite)
+        if not isinstance(sprite, self.proxy_mixin):
+            # Joined and left within the same batch
+            self.pending.remove(sprite)
+            return
+        slot = sprite._slot
+        index = sprite._entity
+        layout = self.layouts[sprite.__class__]
+        sprite.__class__ = sprite.__class__.__bases__[1]
+        state = sprite.__dict__
+        del state["_store"], state["_slot"], state["_entity"]
+        arrays = self.arrays
+        for name, vector, array_index in layout:
+            array = arrays[array_index]
+            if vector:
+                state[name] = pygame.Vector2(array.item(slot, 0), array.item(slot, 1))
+            else:
+                state[name] = array.item(slot)
+
+        self.generations[index] += 1
+        self.entity_slots[index] = -1
+        self.free_entities.append(index)
+
+        # Move the last slot into the hole to keep the arrays dense
+        last = self.count - 1
+        moved = self.slots.pop()
+        if slot != last:
+            for array in arrays:
+                array[slot] = array[last]
+            self.slots[slot] = moved
+            moved._slot = slot
+            self.entity_slots[moved._entity] = slot
+        self.count = last
+
+    def update(self, dt):
+        """Run the store's systems for one tick; by default just move()."""
+        self.move(dt)
+
+    def move(self, dt):
+        """Movement system: advance and wrap every member in one step.
+
+        Args:
+            dt: Time elapsed since last update (in seconds)
+        """
+        count = self.count
+        if not count:
+            return
+        positions = self.positions[:count]
+        self.previous_positions[:count] = positions
+        positions += self.velocities[:count] * dt
+        positions[:, 0] %= self.width
+        positions[:, 1] %= self.height
+
+    def render_positions(self, alpha):
+        """Return every slot's interpolated draw position as [x, y] lists.
+
+        Matches CircleShape.render_position: slots that wrapped during the
+        last tick are drawn at their current position.
+
+        Args:
+            alpha: Fraction of a tick elapsed since the latest update (0-1)
+        """
+        count = self.count
+        current = self.positions[:count]
+        if alpha >= 1:
+            return current.tolist()
+        previous = self.previous_positions[:count]
+        delta = current - previous
+        positions = previous + delta * alpha
+        wrapped = (np.abs(delta[:, 0]) > self.width / 2) | (np.abs(delta[:, 1]) > self.height / 2)
+        positions[wrapped] = current[wrapped]
+        return positions.tolist()
+
+    @classmethod
+    def mixin_for(cls, sprite_class):
+        """Return the proxy mixin for the closest class in sprite_class's MRO."""
+        for base in sprite_class.__mro__:
+            mixin = cls.kind_mixins.get(base)
+            if mixin is not None:
+                return mixin
+        return cls.proxy_mixin
+
+    @classmethod
+    def proxy_class(cls, sprite_class):
+        """Return the cached proxy subclass of the store's mixins for a sprite class."""
+        if issubclass(sprite_class, cls.proxy_mixin):
+            return sprite_class
+        proxies = cls.__dict__.get("proxy_classes")
+        if proxies is None:
+            proxies = cls.proxy_classes = {}
+        proxy = proxies.get(sprite_class)
+        if proxy is None:
+            proxy = type(f"Stored{sprite_class.__name__}",
+                         (cls.mixin_for(sprite_class), sprite_class),
+                         {"__module__": cls.__module__})
+            proxies[sprite_class] = proxy
+        return proxy
+
+    def _layout(self, proxy):
+        layout = self.layouts.get(proxy)
+        if layout is None:
+            layout = self.layouts[proxy] = tuple(
+                (field.name, field.vector, self.array_names.index(field.array_name))
+                for field in proxy.fields())
+        return layout
+
+    def _new_entity(self, slot):
+        if self.free_entities:
+            index = self.free_entities.pop()
+            self.entity_slots[index] = slot
+        else:
+            index = len(self.generations)
+            self.generations.append(0)
+            self.entity_slots.append(slot)
+        return index
+
+    def _add_batch(self, sprites):
+        if not sprites:
+            return
+        start = self.count
+        end = start + len(sprites)
+        while end > len(self.radii):
+            self._grow()
+        self.count = end
+        self.slots.extend(sprites)
+
+        # Sprites of one class share a layout, so their slots are written
+        # together, one array assignment per component
+        proxies = {}
+        by_proxy = {}
+        for slot, sprite in enumerate(sprites, start):
+            sprite_class = type(sprite)
+            proxy = proxies.get(sprite_class)
+            if proxy is None:
+                proxy = proxies[sprite_class] = self.proxy_class(sprite_class)
+            by_proxy.setdefault(proxy, ([], []))
+            slots, members = by_proxy[proxy]
+            slots.append(slot)
+            members.append(sprite)
+
+        arrays = self.arrays
+        for proxy, (slots, members) in by_proxy.items():
+            rows = slots if len(by_proxy) > 1 else slice(start, end)
+            states = [sprite.__dict__ for sprite in members]
+            for name, vector, index in self._layout(proxy):
+                if vector:
+                    arrays[index][rows] = [tuple(state.pop(name)) for state in states]
+                else:
+                    arrays[index][rows] = [state.pop(name) for state in states]
+        if self.tags:
+            tag_values = [self.tag_values(sprite) for sprite in sprites]
+            for column, (name, _) in enumerate(self.tags):
+                getattr(self, name)[start:end] = [values[column] for values in tag_values]
+
+        # Entity indices: freed ones first, then new ones
+        reused = min(len(self.free_entities), len(sprites))
+        entities = self.free_entities[len(self.free_entities) - reused:][::-1]
+        del self.free_entities[len(self.free_entities) - reused:]
+        first_new = len(self.generations)
+        entities.extend(range(first_new, first_new + len(sprites) - reused))
+        self.generations.extend([0] * (len(sprites) - reused))
+        self.entity_slots.extend([-1] * (len(sprites) - reused))
+        entity_slots = self.entity_slots
+
+        for slot, sprite, entity in zip(range(start, end), sprites, entities):
+            entity_slots[entity] = slot
+            sprite._store = self
+            sprite._slot = slot
+            sprite._entity = entity
+            sprite.__class__ = proxies[type(sprite)]
+
+    def _grow(self):
+        capacity = len(self.radii) * 2
+        for name in self.array_names:
+            array = getattr(self, name)
+            setattr(self, name, np.resize(array, (capacity,) + array.shape[1:]))
+        self.arrays = [getattr(self, name) for name in self.array_names]
@@ -0,0 +1,140 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; blasts are then checked shape by shape
+    np = None
+
+from src.constants import EXPLODER_BLAST_DAMAGE, EXPLODER_BLAST_SCALE
+from src.entities.elite_asteroid import EliteAsteroid, ExploderAsteroid
+
+
+class ExplosionManager:
+    """Resolves primed exploder detonations and the chain reactions they set off.
+
+    A primed exploder that is destroyed deals EXPLODER_BLAST_DAMAGE to every
+    asteroid its blast (EXPLODER_BLAST_SCALE times its radius) reaches.
+    Primed exploders destroyed by a blast detonate in turn. The cascade is
+    resolved breadth first within the tick: every exploder that went off in
+    one round is looked up in the NeighborIndex together, damage from that
+    round is applied in one go, and the exploders it destroyed form the next
+    round. Nothing is split until the cascade is over.
+    """
+
+    def __init__(self, neighbor_index, asteroid_store=None):
+        """Create an explosion manager.
+
+        Args:
+            neighbor_index: NeighborIndex over the live asteroids
+            asteroid_store: Optional AsteroidStore holding the same asteroids
+        """
+        self.neighbor_index = neighbor_index
+        self.asteroid_store = asteroid_store
+        self.detonations = 0  # Exploders that went off in the last resolve()
+
+    def resolve(self, exploders):
+        """Detonate exploders and everything their blasts set off.
+
+        Args:
+            exploders: Primed exploders destroyed this tick. They keep their
+                position after being killed, so they may already be dead.
+
+        Returns:
+            list: Asteroids destroyed by blasts, killed but not yet split,
+            in the order they fell
+        """
+        destroyed = []
+        round_exploders = list(exploders)
+        self.detonations = 0
+        while round_exploders:
+            self.detonations += len(round_exploders)
+            victims, hits, angles = self._blast_hits(round_exploders)
+            fallen = self._apply_damage(victims, hits, angles)
+            for asteroid in fallen:
+                asteroid.kill()
+            destroyed.extend(fallen)
+            round_exploders = [asteroid for asteroid in fallen
+                               if isinstance(asteroid, ExploderAsteroid) and asteroid.explosion_primed]
+        return destroyed
+
+    def _blast_hits(self, exploders):
+        """Find what one round of blasts reaches.
+
+        Returns:
+            tuple: (victims, hits, angles) where victims lists each reached
+            asteroid once, hits[i] counts the blasts that reached victims[i]
+            and angles[i] lists the directions they came from
+        """
+        if self.asteroid_store is not None:
+            return self._store_blast_hits(exploders)
+
+        topology = self.neighbor_index.topology
+        victims = {}
+        for exploder in exploders:
+            position = exploder.position
+            blast_radius = exploder.radius * EXPLODER_BLAST_SCALE
+            for asteroid in self.neighbor_index.neighbors(position, blast_radius):
+                if asteroid.alive():
+                    victims.setdefault(asteroid, []).append(topology.angle(asteroid.position, position))
+        return list(victims), [len(angles) for angles in victims.values()], list(victims.values())
+
+    def _store_blast_hits(self, exploders):
+        # Every blast of the round is looked up in the index at once, against
+        # the slots, positions and radii of its refresh this tick
+        index = self.neighbor_index
+        take = np.take
+        centers = np.array([(exploder.position.x, exploder.position.y) for exploder in exploders])
+        blast_radii = np.array([exploder.radius for exploder in exploders]) * EXPLODER_BLAST_SCALE
+        blasts, slots = index.candidates(centers, blast_radii)
+        delta = index.topology.wrap_deltas(take(centers, blasts, axis=0) - take(index.positions, slots, axis=0))
+        reach = take(blast_radii, blasts) + take(index.radii, slots)
+        inside = np.flatnonzero(np.einsum("pk,pk->p", delta, delta) < reach * reach)
+        slots = take(slots, inside)
+        delta = take(delta, inside, axis=0)
+        angles = np.degrees(np.arctan2(delta[:, 1], delta[:, 0])) % 360
+
+        # Group the hits by victim, keeping blast order within each victim
+        order = np.argsort(slots, kind="stable")
+        slots = take(slots, order)
+        angles = take(angles, order).tolist()
+        firsts = np.flatnonzero(np.r_[True, slots[1:] != slots[:-1]])
+        counts = np.diff(np.r_[firsts, len(slots)])
+
+        # Fragments split off this tick are not indexed yet and are spared,
+        # as they are by the shape-by-shape path
+        members = index.members
+        victims = []
+        hits = []
+        blast_angles = []
+        for slot, first, count in zip(slots[firsts].tolist(), firsts.tolist(), counts.tolist()):
+            asteroid = members[slot]
+            if asteroid.alive():
+                victims.append(asteroid)
+                hits.append(count)
+                blast_angles.append(angles[first:first + count])
+        return victims, hits, blast_angles
+
+    def _apply_damage(self, victims, hits, angles):
+        """Apply a round's blast damage and return the asteroids it destroyed."""
+        destroyed = [False] * len(victims)
+        plain = []
+        for index, (asteroid, blast_angles) in enumerate(zip(victims, angles)):
+            if isinstance(asteroid, EliteAsteroid):
+                # Shields and priming need to see each blast
+                for angle in blast_angles:
+                    for _ in range(EXPLODER_BLAST_DAMAGE):
+                        destroyed[index] = asteroid.take_damage(angle)
+            else:
+                plain.append(index)
+
+        # Plain asteroids only lose health, so they are damaged in bulk
+        store = self.asteroid_store
+        if store is not None and plain:
+            slots = np.array([victims[index]._slot for index in plain])
+            store.health[slots] -= np.array([hits[index] for index in plain]) * EXPLODER_BLAST_DAMAGE
+            for index, dead in zip(plain, (store.health[slots] <= 0).tolist()):
+                destroyed[index] = dead
+        else:
+            for index in plain:
+                asteroid = victims[index]
+                asteroid.health -= hits[index] * EXPLODER_BLAST_DAMAGE
+                destroyed[index] = asteroid.health <= 0
+        return [asteroid for asteroid, dead in zip(victims, destroyed) if dead]
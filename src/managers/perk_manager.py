@@ -29,7 +29,8 @@ class Perk:
             player.bullet_pierce += self.value
 
 class PerkManager:
-    def __init__(self):
+    def __init__(self, rng=None):
+        self.rng = rng or random
         self.available_perks = []
         self.init_perks()
 
@@ -74,4 +75,4 @@ class PerkManager:
         if len(self.available_perks) <= count:
             return self.available_perks
 
-        return random.sample(self.available_perks, count)
\ No newline at end of file
+        return self.rng.sample(self.available_perks, count)
\ No newline at end of file
@@ -0,0 +1,127 @@
+from src.constants import POOL_CAPS, POOL_DEFAULT_CAP
+
+
+class ObjectPool:
+    """Free list of killed sprites of a single class.
+
+    Killed sprites are parked as pending and only become reusable after
+    recycle(), which the game calls once per frame. Code that keeps using a
+    sprite right after killing it (Asteroid.split reads its own position and
+    velocity, hit lists still reference used-up shots) therefore never sees
+    it reset under its feet.
+    """
+
+    def __init__(self, cls, cap):
+        """Create an empty pool.
+
+        Args:
+            cls: The exact sprite class this pool hands out
+            cap: Maximum number of free instances kept for reuse
+        """
+        self.cls = cls
+        self.cap = cap
+        self.free = []
+        self.pending = []
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.released = 0
+        self.discarded = 0
+        self.high_water = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+
+    def acquire(self, *args):
+        """Return a reset instance from the free list, or a new one."""
+        if self.free:
+            instance = self.free.pop()
+            instance.reset(*args)
+            self.hits += 1
+        else:
+            instance = self.cls(*args)
+            self.misses += 1
+
+        self.in_use += 1
+        if self.in_use > self.peak_in_use:
+            self.peak_in_use = self.in_use
+        return instance
+
+    def release(self, instance):
+        """Park a killed instance until the next recycle()."""
+        self.pending.append(instance)
+        self.released += 1
+        self.in_use = max(0, self.in_use - 1)
+
+    def recycle(self):
+        """Move parked instances to the free list, up to the cap."""
+        for instance in self.pending:
+            if instance.alive():
+                # Re-added to a group after being killed; not ours any more
+                continue
+            if len(self.free) < self.cap:
+                self.free.append(instance)
+            else:
+                self.discarded += 1
+        self.pending.clear()
+
+        if len(self.free) > self.high_water:
+            self.high_water = len(self.free)
+
+    def stats(self):
+        """Return the pool counters as a dict."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "released": self.released,
+            "discarded": self.discarded,
+            "free": len(self.free),
+            "high_water": self.high_water,
+            "in_use": self.in_use,
+            "peak_in_use": self.peak_in_use,
+        }
+
+
+class PoolManager:
+    """Keeps one ObjectPool per sprite class.
+
+    Assign an instance to a sprite class's ``pools`` attribute (the same way
+    ``containers`` is assigned) to make ``cls.acquire()`` reuse killed
+    instances of that class.
+    """
+
+    def __init__(self, caps=None, default_cap=POOL_DEFAULT_CAP):
+        """Create a pool manager.
+
+        Args:
+            caps: Optional dict of class name to pool cap
+            default_cap: Cap for classes missing from caps
+        """
+        self.caps = dict(POOL_CAPS if caps is None else caps)
+        self.default_cap = default_cap
+        self.pools = {}
+
+    def pool_for(self, cls):
+        """Return the pool for an exact class, creating it on first use."""
+        pool = self.pools.get(cls)
+        if pool is None:
+            cap = self.caps.get(cls.__name__, self.default_cap)
+            pool = self.pools[cls] = ObjectPool(cls, cap)
+        return pool
+
+    def acquire(self, cls, *args):
+        """Return an instance of cls built from args, reusing one if possible."""
+        return self.pool_for(cls).acquire(*args)
+
+    def release(self, instance):
+        """Hand a killed instance back to its class's pool."""
+        self.pool_for(type(instance)).release(instance)
+
+    def recycle(self):
+        """Make every instance killed since the last call reusable."""
+        for pool in self.pools.values():
+            pool.recycle()
+
+    def stats(self):
+        """Return counters for every pool, keyed by class name."""
+        return {cls.__name__: pool.stats() for cls, pool in self.pools.items()}
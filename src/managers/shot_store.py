@@ -0,0 +1,48 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; without it shots update themselves
+    np = None
+
+from src.managers.component_store import ComponentStore, StoredComponents, ScalarField
+
+
+class StoredShot(StoredComponents):
+    """Component proxy for shots: adds the remaining lifetime and pierce.
+
+    While a shot is in a ShotStore, position, velocity, radius, lifetime
+    and pierce read and write the store's arrays, so hits can use up pierce
+    for many shots at once.
+    """
+
+    lifetime = ScalarField("lifetimes")
+    pierce = ScalarField("pierce", dtype=int)
+
+
+class ShotStore(ComponentStore):
+    """Component store for shots.
+
+    Use it in place of the updateables group in the shot containers.
+    update() moves and wraps every shot in one step, counts their lifetimes
+    down and kills the shots whose time ran out.
+    """
+
+    proxy_mixin = StoredShot
+
+    def update(self, dt):
+        """Move all shots and expire the ones whose lifetime is over.
+
+        Args:
+            dt: Time elapsed since last update (in seconds)
+        """
+        count = self.count
+        if not count:
+            return
+        self.move(dt)
+
+        lifetimes = self.lifetimes[:count]
+        lifetimes -= dt
+        expired = np.flatnonzero(lifetimes <= 0).tolist()
+        if expired:
+            # Look the shots up first; each kill moves the last slot
+            for shot in [self.slots[slot] for slot in expired]:
+                shot.kill()
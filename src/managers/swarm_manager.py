@@ -0,0 +1,127 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; followers are then steered one by one
+    np = None
+
+from src.constants import (
+    SWARM_ALIGNMENT,
+    SWARM_COHESION,
+    SWARM_SEPARATION,
+    SWARM_SEPARATION_GAP,
+)
+from src.entities.elite_asteroid import SwarmLeaderAsteroid
+from src.managers.asteroid_store import TYPE_SWARM_LEADER
+
+
+class SwarmManager:
+    """Steers asteroids inside each swarm leader's influence radius.
+
+    Every follower turns towards its leader's heading (alignment) and
+    towards the leader (cohesion), and away from it when they get too close
+    (separation). Pulls from several leaders add up. Followers keep their
+    speed, so swarms change course rather than speed up.
+
+    Followers are found through the shared NeighborIndex. With an asteroid
+    store every leader/follower pair is steered in one array pass.
+    """
+
+    def __init__(self, asteroids, neighbor_index, asteroid_store=None):
+        """Create a swarm manager.
+
+        Args:
+            asteroids: Sprite group of all asteroids
+            neighbor_index: NeighborIndex over the same asteroids, refreshed
+                before each update()
+            asteroid_store: Optional AsteroidStore holding the same asteroids
+        """
+        self.asteroids = asteroids
+        self.neighbor_index = neighbor_index
+        self.asteroid_store = asteroid_store
+
+    def update(self, dt):
+        """Turn every leader's followers for one tick.
+
+        Args:
+            dt: Time elapsed since last update (in seconds)
+        """
+        if self.asteroid_store is not None:
+            self._steer_store(dt)
+        else:
+            self._steer_shapes(dt)
+
+    def _steer_store(self, dt):
+        store = self.asteroid_store
+        count = store.count
+        type_tags = store.type_tags[:count]
+        leader_slots = np.flatnonzero(type_tags == TYPE_SWARM_LEADER)
+        if not len(leader_slots):
+            return
+
+        # Candidate pairs for every leader from the index in one lookup; the
+        # exact range test is batched below
+        positions = store.positions
+        influence = np.array([store.slots[slot].influence_radius for slot in leader_slots.tolist()])
+        queries, followers = self.neighbor_index.candidates(positions[leader_slots], influence)
+        if not len(followers):
+            return
+        # np.take gathers rows far faster than fancy indexing at this size
+        take = np.take
+        leaders = take(leader_slots, queries)
+        radii = store.radii
+        delta = self.neighbor_index.topology.wrap_deltas(
+            take(positions, leaders, axis=0) - take(positions, followers, axis=0))
+        distance_sq = np.einsum("pk,pk->p", delta, delta)
+        reach = take(influence, queries) + take(radii, followers)
+        inside = np.flatnonzero(
+            (distance_sq < reach * reach) & (take(type_tags, followers) != TYPE_SWARM_LEADER))
+        if not len(inside):
+            return
+        leaders = take(leaders, inside)
+        followers = take(followers, inside)
+        delta = take(delta, inside, axis=0)
+        distance_sq = take(distance_sq, inside)
+
+        velocities = store.velocities
+        steer = (SWARM_ALIGNMENT * (take(velocities, leaders, axis=0) - take(velocities, followers, axis=0))
+                 + SWARM_COHESION * delta)
+        gap = take(radii, leaders) + take(radii, followers) + SWARM_SEPARATION_GAP
+        steer -= SWARM_SEPARATION * delta * (distance_sq < gap * gap)[:, np.newaxis]
+
+        # Sum the pulls per follower, then turn each follower once
+        moved = np.flatnonzero(np.bincount(followers, minlength=count))
+        total_x = np.bincount(followers, weights=steer[:, 0], minlength=count)[moved]
+        total_y = np.bincount(followers, weights=steer[:, 1], minlength=count)[moved]
+        old = take(velocities, moved, axis=0)
+        new = old + np.column_stack((total_x, total_y)) * dt
+        speed = np.hypot(old[:, 0], old[:, 1])
+        new_speed = np.hypot(new[:, 0], new[:, 1])
+        turning = new_speed > 0
+        new[turning] *= (speed[turning] / new_speed[turning])[:, np.newaxis]
+        new[~turning] = old[~turning]
+        velocities[moved] = new
+
+    def _steer_shapes(self, dt):
+        topology = self.neighbor_index.topology
+        totals = {}
+        for leader in self.asteroids:
+            if not isinstance(leader, SwarmLeaderAsteroid):
+                continue
+            for follower in self.neighbor_index.neighbors(leader.position, leader.influence_radius):
+                if isinstance(follower, SwarmLeaderAsteroid):
+                    continue
+                delta = topology.delta(follower.position, leader.position)
+                steer = SWARM_ALIGNMENT * (leader.velocity - follower.velocity) + SWARM_COHESION * delta
+                gap = leader.radius + follower.radius + SWARM_SEPARATION_GAP
+                if delta.length_squared() < gap * gap:
+                    steer -= SWARM_SEPARATION * delta
+                if follower in totals:
+                    totals[follower] += steer
+                else:
+                    totals[follower] = steer
+
+        for follower, steer in totals.items():
+            old = follower.velocity
+            new = old + steer * dt
+            if new.length_squared() > 0:
+                new.scale_to_length(old.length())
+                follower.velocity = new
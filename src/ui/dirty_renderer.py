@@ -0,0 +1,81 @@
+import pygame
+
+from src.constants import DIRTY_RECT_THRESHOLD
+
+
+class DirtyRectRenderer:
+    """Clears and presents only the parts of the screen that changed.
+
+    Each frame, clear() erases the rects drawn to last frame instead of
+    filling the whole screen, and present() pushes last frame's and this
+    frame's rects with pygame.display.update(). It falls back to a full
+    fill and flip when the dirty area is large, or after anything was
+    drawn over the whole screen.
+    """
+
+    def __init__(self, screen, threshold=DIRTY_RECT_THRESHOLD, background="black"):
+        """Create a renderer for the display surface.
+
+        Args:
+            screen: The display surface
+            threshold: Fraction of the screen area above which a frame is
+                flipped whole instead of updated rect by rect
+            background: Color the screen is cleared to
+        """
+        self.screen = screen
+        self.threshold = threshold
+        self.background = background
+        self.previous_rects = []
+        self.redraw_all = True
+
+        self.full_frames = 0
+        self.dirty_frames = 0
+        self.skipped_frames = 0
+
+    def invalidate(self):
+        """Make the next frame a full clear and flip."""
+        self.redraw_all = True
+
+    def clear(self):
+        """Erase what last frame drew, or the whole screen if invalidated."""
+        if self.redraw_all:
+            self.screen.fill(self.background)
+        else:
+            for rect in self.previous_rects:
+                self.screen.fill(self.background, rect)
+
+    def present(self, rects, full_screen=False):
+        """Show this frame.
+
+        Args:
+            rects: Screen areas drawn to this frame
+            full_screen: Something covered the whole screen this frame (an
+                overlay), so the whole display must be updated and the
+                next frame cleared in full
+        """
+        dirty = self.previous_rects + rects
+        screen_width, screen_height = self.screen.get_size()
+        dirty_area = sum(rect.width * rect.height for rect in dirty)
+
+        if (self.redraw_all or full_screen
+                or dirty_area > self.threshold * screen_width * screen_height):
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(dirty)
+            self.dirty_frames += 1
+
+        self.previous_rects = rects
+        self.redraw_all = full_screen
+
+    def skip(self):
+        """Count a frame that kept the previous image as it was."""
+        self.skipped_frames += 1
+
+    def stats(self):
+        """Return how many frames were flipped, updated by rects or skipped."""
+        return {
+            "full_frames": self.full_frames,
+            "dirty_frames": self.dirty_frames,
+            "skipped_frames": self.skipped_frames,
+        }
@@ -0,0 +1,150 @@
+import pygame
+
+# Characters rasterized up front for every atlas; others are added on first use
+ATLAS_CHARS = "".join(chr(code) for code in range(32, 127))
+
+# (size, color) pairs the game draws text in, warmed at startup
+UI_TEXT_STYLES = (
+    (20, (200, 200, 200)),
+    (20, 'white'),
+    (24, 'white'),
+    (24, 'lime'),
+    (28, 'white'),
+    (36, 'white'),
+    (72, 'red'),
+)
+
+
+class GlyphAtlas:
+    """Pre-rasterized glyphs of one font in one color.
+
+    The printable ASCII glyphs are rendered once onto a single sheet, and
+    strings are drawn by blitting glyphs from it, so drawing text costs
+    blits rather than FreeType rasterization.
+    """
+
+    def __init__(self, font, color):
+        self.font = font
+        self.color = color
+        self.height = font.get_height()
+        self.glyphs = {}  # char -> (glyph surface, advance in fractional pixels)
+
+        rendered = [(char, font.render(char, True, color)) for char in ATLAS_CHARS]
+        width = sum(glyph.get_width() for _, glyph in rendered)
+        height = max(glyph.get_height() for _, glyph in rendered)
+        self.sheet = pygame.Surface((max(width, 1), height), pygame.SRCALPHA)
+        x = 0
+        for char, glyph in rendered:
+            # Copy the glyph's pixels and alpha as-is onto the empty sheet
+            self.sheet.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            area = pygame.Rect(x, 0, glyph.get_width(), glyph.get_height())
+            self.glyphs[char] = (self.sheet.subsurface(area), self._advance(char, glyph))
+            x += glyph.get_width()
+
+    def size(self, text):
+        """Return the (width, height) text takes up when drawn."""
+        width = 0
+        for char in text:
+            width += self.glyph(char)[1]
+        return round(width), self.height
+
+    def glyph(self, char):
+        """Return (surface, advance) for a character, rasterizing it if new."""
+        entry = self.glyphs.get(char)
+        if entry is None:
+            glyph = self.font.render(char, True, self.color)
+            entry = self.glyphs[char] = (glyph, self._advance(char, glyph))
+        return entry
+
+    def blit(self, screen, text, position):
+        """Draw text with its top-left corner at position."""
+        x, y = position
+        sequence = []
+        for char in text:
+            glyph, advance = self.glyph(char)
+            sequence.append((glyph, (round(x), y)))
+            x += advance
+        screen.blits(sequence, False)
+
+    def render(self, text):
+        """Return a new transparent surface with text drawn on it."""
+        surface = pygame.Surface(self.size(text), pygame.SRCALPHA)
+        x = 0
+        for char in text:
+            glyph, advance = self.glyph(char)
+            surface.blit(glyph, (round(x), 0), special_flags=pygame.BLEND_RGBA_MAX)
+            x += advance
+        return surface
+
+    def _advance(self, char, glyph):
+        # Whole-pixel metrics drop the fractional part of each advance, which
+        # adds up along a string; measure a run of the glyph instead
+        width = self.font.size(char * 16)[0] / 16
+        return width if width > 0 else glyph.get_width()
+
+
+class FontRegistry:
+    """Loads each font face and size once and hands out glyph atlases.
+
+    One registry is shared by everything that draws text, so fonts are
+    never reloaded per frame and each (face, size, color) is rasterized
+    only once.
+    """
+
+    def __init__(self):
+        self.fonts = {}
+        self.atlases = {}
+
+    def font(self, size, name=None):
+        """Return the font for a face and size, loading it on first use.
+
+        Args:
+            size: Point size
+            name: Font file, or None for pygame's default font
+        """
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = self.fonts[key] = pygame.font.Font(name, size)
+        return font
+
+    def atlas(self, size, color, name=None):
+        """Return the glyph atlas for a face, size and color."""
+        key = (name, size, tuple(pygame.Color(color)))
+        atlas = self.atlases.get(key)
+        if atlas is None:
+            atlas = self.atlases[key] = GlyphAtlas(self.font(size, name), color)
+        return atlas
+
+    def render(self, text, size, color, name=None):
+        """Return text drawn onto a new transparent surface."""
+        return self.atlas(size, color, name).render(text)
+
+    def blit(self, screen, text, size, color, position=None, center=None, name=None):
+        """Draw text straight from the atlas.
+
+        Args:
+            screen: Surface to draw on
+            text: String to draw
+            size: Point size
+            color: Text color
+            position: Top-left corner of the text
+            center: Center of the text, used instead of position if given
+            name: Font file, or None for pygame's default font
+
+        Returns:
+            pygame.Rect: Area covered by the text
+        """
+        atlas = self.atlas(size, color, name)
+        rect = pygame.Rect((0, 0), atlas.size(text))
+        if center is not None:
+            rect.center = center
+        elif position is not None:
+            rect.topleft = position
+        atlas.blit(screen, text, rect.topleft)
+        return rect
+
+    def warm(self, styles=UI_TEXT_STYLES):
+        """Build the atlases for (size, color) pairs ahead of first use."""
+        for size, color in styles:
+            self.atlas(size, color)
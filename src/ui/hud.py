@@ -0,0 +1,110 @@
+from src.constants import SCREEN_WIDTH, PLAYER_SPEED, PLAYER_SHOOT_COOLDOWN
+from src.ui.fonts import FontRegistry
+
+# Rendered text surfaces kept around; oldest entries are dropped past this
+TEXT_CACHE_SIZE = 256
+
+
+class HUD:
+    """In-game HUD showing credits, wave and player stats.
+
+    Text is drawn from the shared glyph atlases, rendered lines are cached
+    by (text, size, color), and the layout is only rebuilt when a displayed
+    value changes, so a steady frame costs one blits() call.
+    """
+
+    def __init__(self, fonts=None):
+        self.fonts = fonts or FontRegistry()
+        self.text_cache = {}
+        self.values = None
+        self.items = []
+
+    def render_text(self, text, size, color):
+        """Return a rendered text surface, rendering it only on a cache miss."""
+        key = (text, size, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            if len(self.text_cache) >= TEXT_CACHE_SIZE:
+                del self.text_cache[next(iter(self.text_cache))]
+            surface = self.text_cache[key] = self.fonts.render(text, size, color)
+        return surface
+
+    def draw(self, screen, simulation):
+        """Draw the HUD for the simulation's current state
+
+        Args:
+            screen: Surface to draw on
+            simulation: The GameSimulation being displayed
+        """
+        screen.blits(self.collect(simulation), False)
+
+    def collect(self, simulation):
+        """Return the HUD as (surface, position) pairs, for a RenderQueue"""
+        player = simulation.player
+        values = (simulation.credits, simulation.wave, player.hp, player.max_hp,
+                  player.speed_multiplier, player.fire_rate_multiplier,
+                  player.bullet_pierce, len(player.perks))
+        if values != self.values:
+            self.values = values
+            self.items = self._layout(simulation)
+        return self.items
+
+    def _layout(self, simulation):
+        player = simulation.player
+        items = []
+
+        # Game stats (credits, wave)
+        items.append((self.render_text(f"Credits: {simulation.credits}", 36, 'white'), (10, 10)))
+        wave_surf = self.render_text(f"Wave: {simulation.wave}", 36, 'white')
+        items.append((wave_surf, (SCREEN_WIDTH - wave_surf.get_width() - 10, 10)))
+
+        # Player stats - vertical layout in top left
+        y_offset = 50
+        line_height = 30
+
+        # HP display
+        items.append((self.render_text(f"HP: {player.hp}/{player.max_hp}", 36, 'white'), (10, y_offset)))
+        y_offset += line_height
+
+        # Speed display - base value + modifier
+        speed_base = PLAYER_SPEED
+        speed_mod = int(speed_base * player.speed_multiplier) - speed_base
+        speed_surf = self.render_text(f"Speed: {speed_base}", 36, 'white')
+        items.append((speed_surf, (10, y_offset)))
+
+        # Add modifier in green if it exists
+        if speed_mod != 0:
+            mod_text = f"+{speed_mod}" if speed_mod > 0 else f"{speed_mod}"
+            mod_surf = self.render_text(mod_text, 24, 'lime')
+            items.append((mod_surf, (10 + speed_surf.get_width() + 5, y_offset + 5)))
+        y_offset += line_height
+
+        # Fire rate display - base value + modifier
+        fire_rate_base = 1 / PLAYER_SHOOT_COOLDOWN
+        fire_rate_mod = fire_rate_base * player.fire_rate_multiplier - fire_rate_base
+        fire_rate_surf = self.render_text(f"Fire Rate: {fire_rate_base:.1f}/s", 36, 'white')
+        items.append((fire_rate_surf, (10, y_offset)))
+
+        # Add modifier in green if it exists
+        if fire_rate_mod != 0:
+            mod_text = f"+{fire_rate_mod:.1f}" if fire_rate_mod > 0 else f"{fire_rate_mod:.1f}"
+            mod_surf = self.render_text(mod_text, 24, 'lime')
+            items.append((mod_surf, (10 + fire_rate_surf.get_width() + 5, y_offset + 5)))
+        y_offset += line_height
+
+        # Bullet pierce display
+        if player.bullet_pierce > 0:
+            items.append((self.render_text(f"Pierce: {player.bullet_pierce}", 36, 'white'), (10, y_offset)))
+            y_offset += line_height
+
+        # Active perks list
+        if player.perks:
+            items.append((self.render_text("Active Perks:", 28, 'white'), (10, y_offset)))
+            y_offset += 25
+
+            # List each perk on its own line
+            for perk in player.perks:
+                items.append((self.render_text(f"• {perk.name}", 24, 'lime'), (20, y_offset)))
+                y_offset += 20
+
+        return items
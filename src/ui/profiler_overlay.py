@@ -0,0 +1,85 @@
+import pygame
+
+from src.constants import SCREEN_WIDTH
+
+PANEL_WIDTH = 485
+GRAPH_HEIGHT = 60
+ROW_HEIGHT = 18
+GRAPH_MAX_MS = 1000 / 30  # Top of the graph; taller frames are clipped
+BUDGET_MS = 1000 / 60  # Reference line for a 60 FPS frame
+
+
+class ProfilerOverlay:
+    """Toggleable panel showing a frame-time graph and per-scope statistics.
+
+    The panel is rebuilt every refresh_frames draws and blitted as one
+    surface in between, so leaving it open barely shows up in its own
+    numbers.
+    """
+
+    def __init__(self, profiler, fonts, graph_scope="frame", refresh_frames=10):
+        """Create a hidden overlay.
+
+        Args:
+            profiler: Profiler whose scopes are shown
+            fonts: FontRegistry for the panel text
+            graph_scope: Scope whose recent samples are graphed
+            refresh_frames: Draws between panel rebuilds
+        """
+        self.profiler = profiler
+        self.fonts = fonts
+        self.graph_scope = graph_scope
+        self.refresh_frames = refresh_frames
+        self.visible = False
+        self.panel = None
+        self.frames_until_refresh = 0
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.frames_until_refresh = 0
+
+    def draw(self, screen):
+        """Draw the panel if visible
+
+        Returns:
+            pygame.Rect: Area drawn to, or None when hidden
+        """
+        if not self.visible:
+            return None
+        if self.frames_until_refresh <= 0 or self.panel is None:
+            self.panel = self._build_panel()
+            self.frames_until_refresh = self.refresh_frames
+        self.frames_until_refresh -= 1
+        return screen.blit(self.panel, (SCREEN_WIDTH - PANEL_WIDTH - 10, 50))
+
+    def _build_panel(self):
+        stats = self.profiler.stats()
+        height = 10 + GRAPH_HEIGHT + 10 + ROW_HEIGHT * (len(stats) + 1) + 10
+        panel = pygame.Surface((PANEL_WIDTH, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 200))
+
+        # Frame time graph, newest sample on the right
+        graph = pygame.Rect(10, 10, PANEL_WIDTH - 20, GRAPH_HEIGHT)
+        pygame.draw.rect(panel, (60, 60, 60), graph, 1)
+        samples = self.profiler.buffer(self.graph_scope).values()[-graph.width:]
+        x = graph.right - len(samples)
+        for seconds in samples:
+            ms = seconds * 1000
+            bar = min(graph.height, int(ms / GRAPH_MAX_MS * graph.height))
+            color = (80, 200, 80) if ms <= BUDGET_MS else (230, 80, 60)
+            pygame.draw.line(panel, color, (x, graph.bottom - 1), (x, graph.bottom - 1 - bar))
+            x += 1
+        budget_y = graph.bottom - 1 - int(BUDGET_MS / GRAPH_MAX_MS * graph.height)
+        pygame.draw.line(panel, (200, 200, 50), (graph.left, budget_y), (graph.right - 1, budget_y))
+
+        # Per-scope statistics in milliseconds
+        y = graph.bottom + 10
+        columns = (("scope", 10), ("min", 150), ("avg", 215), ("p95", 280), ("p99", 345), ("max", 410))
+        for label, column_x in columns:
+            self.fonts.blit(panel, label, 20, (200, 200, 200), position=(column_x, y))
+        for name, scope in stats.items():
+            y += ROW_HEIGHT
+            self.fonts.blit(panel, name, 20, 'white', position=(10, y))
+            for key, column_x in columns[1:]:
+                self.fonts.blit(panel, f"{scope[key]:.2f}", 20, 'white', position=(column_x, y))
+        return panel
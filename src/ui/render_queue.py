@@ -0,0 +1,103 @@
+import time
+
+from src.constants import RENDER_LAYERS
+from src.utils.topology import WORLD
+
+
+class RenderQueue:
+    """Per-frame draw list, submitted with one Surface.blits() call per layer.
+
+    Entities push (surface, position) pairs during a collection pass instead
+    of drawing themselves; flush() then draws the layers back to front and
+    records how many blits each layer took and how long it spent in them.
+    Sprites hanging over a screen edge are also drawn on the opposite edge,
+    matching the wrapping world collisions are checked in.
+    """
+
+    def __init__(self, topology=WORLD):
+        self.topology = topology
+        self.layers = [[] for _ in RENDER_LAYERS]
+        # Counters from the last flush, indexed like RENDER_LAYERS
+        self.counts = [0] * len(RENDER_LAYERS)
+        self.seconds = [0.0] * len(RENDER_LAYERS)
+
+    def push(self, layer, surface, position):
+        """Queue one surface to be drawn at position on a layer."""
+        self.layers[layer].append((surface, position))
+
+    def extend(self, layer, items):
+        """Queue (surface, position) pairs on a layer."""
+        self.layers[layer].extend(items)
+
+    def collect(self, drawables, alpha=1.0, stores=()):
+        """Queue the cached sprite of every drawable on its render_layer
+
+        Args:
+            drawables: Shapes with sprite() and render_layer
+            alpha: Fraction of a tick elapsed since the latest update (0-1)
+            stores: Component stores (such as the AsteroidStore); their
+                members are queued with positions interpolated in one
+                array pass per store
+        """
+        layers = self.layers
+        if stores:
+            for store in stores:
+                self._collect_store(store, alpha)
+            for drawable in drawables:
+                if getattr(drawable, "_store", None) not in stores:
+                    layers[drawable.render_layer].append(drawable.sprite(alpha))
+        else:
+            for drawable in drawables:
+                layers[drawable.render_layer].append(drawable.sprite(alpha))
+
+    def _collect_store(self, store, alpha):
+        layers = self.layers
+        for sprite, (x, y) in zip(store.slots, store.render_positions(alpha)):
+            surface = sprite.sprites.get(sprite.sprite_key(), sprite.render_sprite)
+            half = surface.get_width() / 2
+            layers[sprite.render_layer].append((surface, (x - half, y - half)))
+
+    def flush(self, screen, track_rects=False):
+        """Draw everything queued, back to front, and empty the queue.
+
+        Args:
+            screen: Surface to draw on
+            track_rects: Collect the screen area of every blit
+
+        Returns:
+            list: Rects drawn to when track_rects is set, else an empty list
+        """
+        rects = []
+        for index, items in enumerate(self.layers):
+            start = time.perf_counter()
+            if items:
+                self._add_seam_copies(items)
+                if track_rects:
+                    rects.extend(screen.blits(items, True))
+                else:
+                    screen.blits(items, False)
+            self.seconds[index] = time.perf_counter() - start
+            self.counts[index] = len(items)
+            items.clear()
+        return rects
+
+    def _add_seam_copies(self, items):
+        width = self.topology.width
+        height = self.topology.height
+        copies = []
+        for surface, (x, y) in items:
+            w, h = surface.get_size()
+            if x >= 0 and y >= 0 and x + w <= width and y + h <= height:
+                continue
+            shifts_x = (0, width) if x < 0 else (0, -width) if x + w > width else (0,)
+            shifts_y = (0, height) if y < 0 else (0, -height) if y + h > height else (0,)
+            for shift_x in shifts_x:
+                for shift_y in shifts_y:
+                    if shift_x or shift_y:
+                        copies.append((surface, (x + shift_x, y + shift_y)))
+        items.extend(copies)
+
+    def stats(self):
+        """Return the last flush's blit count and milliseconds per layer."""
+        return {name: {"count": self.counts[index], "ms": self.seconds[index] * 1000}
+                for index, name in enumerate(RENDER_LAYERS)}
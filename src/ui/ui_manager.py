@@ -1,11 +1,15 @@
 import pygame
-from src.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.constants import SCREEN_WIDTH, SCREEN_HEIGHT, STATE_WAVE_TRANSITION, STATE_PERK_SELECTION
+from src.ui.fonts import FontRegistry
+
+OVERLAY_COLOR = (0, 0, 0, 180)
 
 class Button:
-    def __init__(self, x, y, width, height, text, font, callback=None):
+    def __init__(self, x, y, width, height, text, fonts, callback=None, font_size=36):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
-        self.font = font
+        self.fonts = fonts
+        self.font_size = font_size
         self.callback = callback
         self.hovered = False
 
@@ -16,9 +20,7 @@ class Button:
         pygame.draw.rect(screen, (200, 200, 200), self.rect, 2)
 
         # Draw button text
-        text_surf = self.font.render(self.text, True, (255, 255, 255))
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        screen.blit(text_surf, text_rect)
+        self.fonts.blit(screen, self.text, self.font_size, (255, 255, 255), center=self.rect.center)
 
     def update(self, mouse_pos, mouse_clicked):
         self.hovered = self.rect.collidepoint(mouse_pos)
@@ -28,28 +30,28 @@ class Button:
         return False
 
 class PerkCard:
-    def __init__(self, x, y, width, height, perk, font, callback=None):
+    def __init__(self, x, y, width, height, perk, fonts, callback=None):
         self.rect = pygame.Rect(x, y, width, height)
         self.perk = perk
-        self.font = font
+        self.fonts = fonts
         self.callback = callback
         self.hovered = False
 
-    def draw(self, screen):
-        # Draw card background
-        color = (30, 100, 30) if self.hovered else (20, 70, 20)
+    def draw(self, screen, hovered=None):
+        # Draw card background; hovered=False draws the idle look regardless
+        if hovered is None:
+            hovered = self.hovered
+        color = (30, 100, 30) if hovered else (20, 70, 20)
         pygame.draw.rect(screen, color, self.rect)
         pygame.draw.rect(screen, (200, 200, 200), self.rect, 2)
 
         # Draw perk title
-        title_font = pygame.font.Font(None, 28)
-        title_surf = title_font.render(self.perk.name, True, (255, 255, 255))
-        screen.blit(title_surf, (self.rect.x + 10, self.rect.y + 10))
+        self.fonts.blit(screen, self.perk.name, 28, (255, 255, 255),
+                        position=(self.rect.x + 10, self.rect.y + 10))
 
         # Draw perk description
-        desc_font = pygame.font.Font(None, 20)
-        desc_surf = desc_font.render(self.perk.description, True, (200, 200, 200))
-        screen.blit(desc_surf, (self.rect.x + 10, self.rect.y + 40))
+        self.fonts.blit(screen, self.perk.description, 20, (200, 200, 200),
+                        position=(self.rect.x + 10, self.rect.y + 40))
 
     def update(self, mouse_pos, mouse_clicked):
         self.hovered = self.rect.collidepoint(mouse_pos)
@@ -59,13 +61,15 @@ class PerkCard:
         return False
 
 class UIManager:
-    def __init__(self, screen):
+    def __init__(self, screen, fonts=None):
         self.screen = screen
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        self.fonts = fonts or FontRegistry()
+        # Pre-composited overlay screens: name -> (cache key, surface)
+        self.layers = {}
         self.wave_transition = False
         self.perk_selection = False
         self.countdown = 0
+        self.wave_num = 0
         self.buttons = []
         self.perk_cards = []
         self.selected_perk = None
@@ -92,7 +96,27 @@ class UIManager:
         for i, perk in enumerate(perks):
             x = start_x + i * (card_width + card_spacing)
             y = screen_center_y - (card_height // 2)
-            self.perk_cards.append(PerkCard(x, y, card_width, card_height, perk, self.small_font, callback))
+            self.perk_cards.append(PerkCard(x, y, card_width, card_height, perk, self.fonts, callback))
+
+    def sync(self, simulation, perk_callback):
+        """Mirror the simulation's wave countdown and perk choice on screen
+
+        Args:
+            simulation: The GameSimulation being displayed
+            perk_callback: Called with the perk when a perk card is clicked
+        """
+        if simulation.state == STATE_WAVE_TRANSITION:
+            if not self.wave_transition or self.wave_num != simulation.wave:
+                self.show_wave_transition(simulation.wave, simulation.countdown)
+            self.countdown = simulation.countdown
+        else:
+            self.wave_transition = False
+
+        if simulation.state == STATE_PERK_SELECTION:
+            if not self.perk_selection:
+                self.show_perk_selection(simulation.perks_available, perk_callback)
+        else:
+            self.perk_selection = False
 
     def update(self, dt, events):
         mouse_pos = pygame.mouse.get_pos()
@@ -102,12 +126,7 @@ class UIManager:
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 mouse_clicked = True
 
-        if self.wave_transition:
-            self.countdown -= dt
-            if self.countdown <= 0:
-                self.wave_transition = False
-                return True  # Signal to start the wave
-
+        # The wave countdown itself is run by the simulation; see sync()
         if self.perk_selection:
             for card in self.perk_cards:
                 if card.update(mouse_pos, mouse_clicked):
@@ -120,42 +139,84 @@ class UIManager:
 
         return False
 
+    def frame_key(self):
+        """Return a value that changes whenever the UI would draw differently"""
+        return (self.wave_transition, self.wave_num, int(self.countdown) if self.countdown > 0 else -1,
+                self.perk_selection, tuple(card.hovered for card in self.perk_cards))
+
     def draw(self):
         if self.wave_transition:
-            # Draw semi-transparent overlay
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            self.screen.blit(overlay, (0, 0))
-
-            # Draw wave info
-            wave_text = f"WAVE {self.wave_num}"
-            wave_surf = self.font.render(wave_text, True, (255, 255, 255))
-            text_rect = wave_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30))
-            self.screen.blit(wave_surf, text_rect)
+            # Overlay and wave title only change with the wave
+            layer = self._layer("wave_transition", self.wave_num, self._build_wave_transition)
+            self.screen.blit(layer, (0, 0))
 
             # Draw countdown if > 0
             if self.countdown > 0:
                 count_text = f"Starting in {int(self.countdown) + 1}..."
-                count_surf = self.small_font.render(count_text, True, (255, 255, 255))
-                count_rect = count_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
-                self.screen.blit(count_surf, count_rect)
+                self.fonts.blit(self.screen, count_text, 24, (255, 255, 255),
+                                center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
 
         if self.perk_selection:
-            # Draw semi-transparent overlay
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            self.screen.blit(overlay, (0, 0))
-
-            # Draw title
-            title_text = "SELECT AN UPGRADE"
-            title_surf = self.font.render(title_text, True, (255, 255, 255))
-            title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
-            self.screen.blit(title_surf, title_rect)
-
-            # Draw perk cards
+            # Overlay, title and idle cards only change with the perk list
+            perks = tuple(card.perk for card in self.perk_cards)
+            layer = self._layer("perk_selection", perks, self._build_perk_selection)
+            self.screen.blit(layer, (0, 0))
+
+            # Only a hovered card differs from the cached layer
             for card in self.perk_cards:
-                card.draw(self.screen)
+                if card.hovered:
+                    card.draw(self.screen)
 
         # Draw buttons
         for button in self.buttons:
-            button.draw(self.screen)
\ No newline at end of file
+            button.draw(self.screen)
+
+    def draw_game_over(self, final_score):
+        """Draw the game over screen over the frozen game
+
+        Args:
+            final_score: Credits to show as the final score
+        """
+        self.screen.blit(self._layer("game_over", None, self._build_game_over), (0, 0))
+
+        # Draw final score
+        self.fonts.blit(self.screen, f"Final Score: {final_score}", 36, 'white',
+                        center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
+
+    def _layer(self, name, key, build):
+        """Return a cached full-screen layer, rebuilt when key or the screen size changes."""
+        key = (self.screen.get_size(), key)
+        cached = self.layers.get(name)
+        if cached is None or cached[0] != key:
+            # Reuse the previous surface when the size still matches
+            if cached is not None and cached[1].get_size() == key[0]:
+                layer = cached[1]
+            else:
+                layer = pygame.Surface(key[0], pygame.SRCALPHA)
+            layer.fill(OVERLAY_COLOR)
+            build(layer)
+            cached = self.layers[name] = (key, layer)
+        return cached[1]
+
+    def _build_wave_transition(self, layer):
+        # Draw wave info
+        self.fonts.blit(layer, f"WAVE {self.wave_num}", 36, (255, 255, 255),
+                        center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30))
+
+    def _build_perk_selection(self, layer):
+        # Draw title
+        self.fonts.blit(layer, "SELECT AN UPGRADE", 36, (255, 255, 255),
+                        center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
+
+        # Draw perk cards
+        for card in self.perk_cards:
+            card.draw(layer, hovered=False)
+
+    def _build_game_over(self, layer):
+        # Draw game over text
+        self.fonts.blit(layer, "GAME OVER", 72, 'red',
+                        center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
+
+        # Draw restart prompt
+        self.fonts.blit(layer, "Press R to restart or Q to quit", 36, 'white',
+                        center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 70))
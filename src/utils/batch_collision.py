@@ -0,0 +1,97 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; callers fall back to per-pair checks
+    np = None
+
+available = np is not None
+
+
+def shape_arrays(shapes):
+    """Pack circle shapes into position and radius arrays.
+
+    Args:
+        shapes: Sequence of objects with position and radius attributes
+
+    Returns:
+        tuple: (positions, radii) as float arrays of shape (n, 2) and (n,)
+    """
+    positions = np.array([(shape.position.x, shape.position.y) for shape in shapes],
+                         dtype=float).reshape(-1, 2)
+    radii = np.array([shape.radius for shape in shapes], dtype=float)
+    return positions, radii
+
+
+def circle_hits(shot_positions, shot_radii, target_positions, target_radii, topology=None):
+    """Find every overlapping shot/target pair in one pass.
+
+    Uses the same strict "distance < r1 + r2" test as
+    CircleShape.collision_check, on squared distances. With a topology the
+    pair offsets are folded to their minimal images in place, so pairs
+    across a wrap seam are caught without adding any shifted copies.
+
+    Args:
+        shot_positions: Array of shape (shots, 2)
+        shot_radii: Array of shape (shots,)
+        target_positions: Array of shape (targets, 2)
+        target_radii: Array of shape (targets,)
+        topology: Optional WorldTopology the positions wrap in
+
+    Returns:
+        tuple: (target_indices, shot_indices) of the hits, ordered by target
+        and then by shot, matching a nested "for target: for shot:" loop
+    """
+    delta = shot_positions[np.newaxis, :, :] - target_positions[:, np.newaxis, :]
+    if topology is not None:
+        topology.wrap_deltas(delta)
+    distance_sq = np.einsum("tsk,tsk->ts", delta, delta)
+    reach = target_radii[:, np.newaxis] + shot_radii[np.newaxis, :]
+    return np.nonzero(distance_sq < reach * reach)
+
+
+def pair_hits(shot_positions, shot_radii, target_positions, target_radii,
+              target_rows, shot_rows, topology=None):
+    """Narrow phase for candidate pairs from a broadphase.
+
+    The same test as circle_hits(), run only on the given pairs.
+
+    Args:
+        shot_positions: Array of shape (shots, 2)
+        shot_radii: Array of shape (shots,)
+        target_positions: Array of shape (targets, 2)
+        target_radii: Array of shape (targets,)
+        target_rows: Target of each candidate pair
+        shot_rows: Shot of each candidate pair; no pair may repeat
+        topology: Optional WorldTopology the positions wrap in
+
+    Returns:
+        tuple: (target_indices, shot_indices) of the hits, in the same order
+        as circle_hits()
+    """
+    take = np.take
+    delta = take(shot_positions, shot_rows, axis=0) - take(target_positions, target_rows, axis=0)
+    if topology is not None:
+        topology.wrap_deltas(delta)
+    distance_sq = np.einsum("pk,pk->p", delta, delta)
+    reach = take(target_radii, target_rows) + take(shot_radii, shot_rows)
+    hits = np.flatnonzero(distance_sq < reach * reach)
+    target_rows = take(target_rows, hits)
+    shot_rows = take(shot_rows, hits)
+    order = np.lexsort((shot_rows, target_rows))
+    return take(target_rows, order), take(shot_rows, order)
+
+
+def attack_angles(shot_positions, target_positions, topology=None):
+    """Vectorized Shot.get_attack_angle.
+
+    Args:
+        shot_positions: Array of shape (n, 2)
+        target_positions: Array of shape (n, 2), paired row by row
+        topology: Optional WorldTopology the positions wrap in
+
+    Returns:
+        ndarray: Angles in degrees (0-360) of each shot as seen from its target
+    """
+    direction = shot_positions - target_positions
+    if topology is not None:
+        topology.wrap_deltas(direction)
+    return np.degrees(np.arctan2(direction[:, 1], direction[:, 0])) % 360
@@ -1,8 +1,19 @@
 import pygame
 
+from src.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from src.utils.sprite_cache import SpriteCache, blank_sprite
+from src.utils.topology import WORLD
+
 
 # Base class for game objects
 class CircleShape(pygame.sprite.Sprite):
+    # Set to a PoolManager to recycle killed instances through acquire()
+    pools = None
+    # Pre-rendered sprites, shared by every shape class; see sprite()
+    sprites = SpriteCache()
+    # Wrapping world used for every distance and overlap check
+    topology = WORLD
+
     def __init__(self, x, y, radius):
         if hasattr(self, "containers"):
             super().__init__(self.containers)
@@ -10,19 +21,82 @@ class CircleShape(pygame.sprite.Sprite):
             super().__init__()
 
         self.position = pygame.Vector2(x, y)
+        self.previous_position = pygame.Vector2(x, y)
         self.velocity = pygame.Vector2(0, 0)
         self.radius = radius
 
-    def draw(self, screen):
-        pass
+    @classmethod
+    def acquire(cls, *args):
+        """Create an instance, reusing a killed one when pooling is enabled"""
+        if cls.pools is None:
+            return cls(*args)
+        return cls.pools.acquire(cls, *args)
+
+    def reset(self, x, y, radius):
+        """Reinitialize a pooled instance in place and rejoin its groups"""
+        # Vectors are updated before rejoining so groups that copy state on
+        # add (such as AsteroidStore) see the new values
+        self.position.update(x, y)
+        self.previous_position.update(x, y)
+        self.velocity.update(0, 0)
+        self.radius = radius
+        if hasattr(self, "containers"):
+            self.add(self.containers)
+
+    def kill(self):
+        was_alive = self.alive()
+        super().kill()
+        if was_alive and self.pools is not None:
+            self.pools.release(self)
+
+    def render_position(self, alpha):
+        """Position to draw at, interpolated between the last two ticks
+
+        Args:
+            alpha: Fraction of a tick elapsed since the latest update (0-1)
+        """
+        previous = self.previous_position
+        current = self.position
+        # Don't interpolate across a screen wrap; that would sweep the shape
+        # across the whole screen for one frame
+        if (alpha >= 1
+                or abs(current.x - previous.x) > SCREEN_WIDTH / 2
+                or abs(current.y - previous.y) > SCREEN_HEIGHT / 2):
+            return current
+        return previous.lerp(current, alpha)
+
+    def draw(self, screen, alpha=1.0):
+        screen.blit(*self.sprite(alpha))
+
+    def sprite(self, alpha=1.0):
+        """Return the cached sprite and the top-left corner to blit it at
+
+        Args:
+            alpha: Fraction of a tick elapsed since the latest update (0-1)
+        """
+        surface = self.sprites.get(self.sprite_key(), self.render_sprite)
+        position = self.render_position(alpha)
+        half = surface.get_width() / 2
+        return surface, (position.x - half, position.y - half)
+
+    def sprite_key(self):
+        """Describe everything that changes how this shape looks
+
+        Subclasses that draw more than an outline override this together
+        with render_sprite().
+        """
+        return ('circle', self.radius)
+
+    def render_sprite(self, key):
+        """Draw the sprite for a sprite_key() onto a new surface"""
+        _, radius = key
+        surface, center = blank_sprite(radius)
+        pygame.draw.circle(surface, "white", center, radius, 2)
+        return surface
 
     def update(self, dt):
         pass
 
     def collision_check(self, circle_object):
-        if (
-            self.position.distance_to(circle_object.position)
-            < self.radius + circle_object.radius
-        ):
-            return True
-        return False
\ No newline at end of file
+        return self.topology.overlaps(self.position, self.radius,
+                                      circle_object.position, circle_object.radius)
\ No newline at end of file
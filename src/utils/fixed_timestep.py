@@ -0,0 +1,49 @@
+from src.constants import MAX_CATCH_UP_STEPS, SIMULATION_RATE
+
+
+class FixedTimestep:
+    """Accumulator that turns variable frame times into fixed simulation steps.
+
+    Each frame, advance() banks the real time that passed and reports how
+    many whole steps of dt to simulate. The leftover fraction is exposed as
+    alpha so drawing can interpolate between the last two steps.
+    """
+
+    def __init__(self, rate=SIMULATION_RATE, max_steps=MAX_CATCH_UP_STEPS):
+        """Create a timestep accumulator.
+
+        Args:
+            rate: Simulation steps per second
+            max_steps: Most steps run for one frame. Time beyond that is
+                dropped, so a long stall slows the game down briefly instead
+                of triggering ever longer catch-up frames.
+        """
+        self.dt = 1 / rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.dropped_time = 0.0
+
+    @property
+    def alpha(self):
+        """Fraction of a step between the last simulated state and now (0-1)."""
+        return min(1.0, self.accumulator / self.dt)
+
+    def advance(self, frame_time):
+        """Bank a frame's elapsed time.
+
+        Args:
+            frame_time: Real seconds since the previous frame
+
+        Returns:
+            int: Number of fixed steps to simulate this frame
+        """
+        self.accumulator += frame_time
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            self.dropped_time += (steps - self.max_steps) * self.dt
+            steps = self.max_steps
+            # Keep only the sub-step remainder of the dropped backlog
+            self.accumulator %= self.dt
+        else:
+            self.accumulator -= steps * self.dt
+        return steps
@@ -0,0 +1,130 @@
+import random
+
+import pygame
+
+ABILITY_KEYS = (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5)
+
+
+class InputState:
+    """Player controls for a single simulation tick."""
+
+    def __init__(self, rotate_left=False, rotate_right=False, thrust=False,
+                 reverse=False, shoot=False, abilities=None, perk_choice=None):
+        """Create an input state.
+
+        Args:
+            rotate_left: Turn the ship left (A)
+            rotate_right: Turn the ship right (D)
+            thrust: Move forward (W)
+            reverse: Move backward (S)
+            shoot: Fire (space or left mouse button)
+            abilities: Five flags for the ability keys 1-5
+            perk_choice: Index of the perk to pick on the perk selection
+                screen, or None
+        """
+        self.rotate_left = rotate_left
+        self.rotate_right = rotate_right
+        self.thrust = thrust
+        self.reverse = reverse
+        self.shoot = shoot
+        self.abilities = tuple(abilities) if abilities else (False,) * len(ABILITY_KEYS)
+        self.perk_choice = perk_choice
+
+
+class KeyboardInput:
+    """Input source that reads the pygame keyboard and mouse."""
+
+    def __init__(self):
+        # One-shot input is held until a tick has used it: the perk picked
+        # on the perk selection screen, and a click too short to still be
+        # held down on a later frame
+        self.perk_choice = None
+        self.clicked = False
+
+    def poll(self, events):
+        """Sample the controls for this frame.
+
+        Args:
+            events: Events returned by pygame.event.get() this frame
+
+        Returns:
+            InputState: Current controls
+        """
+        keys = pygame.key.get_pressed()
+        if any(event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 for event in events):
+            self.clicked = True
+        return InputState(
+            rotate_left=keys[pygame.K_a],
+            rotate_right=keys[pygame.K_d],
+            thrust=keys[pygame.K_w],
+            reverse=keys[pygame.K_s],
+            shoot=keys[pygame.K_SPACE] or self.clicked or pygame.mouse.get_pressed()[0],
+            abilities=[keys[key] for key in ABILITY_KEYS],
+            perk_choice=self.perk_choice,
+        )
+
+    def consume(self):
+        """Drop the held one-shot input once a tick has stepped with it.
+
+        Frames that run no simulation step keep it for the next poll.
+        """
+        self.perk_choice = None
+        self.clicked = False
+
+
+class ScriptedInput:
+    """Input source that plays back a fixed list of input states."""
+
+    def __init__(self, states, loop=False):
+        """Create a scripted input source.
+
+        Args:
+            states: Sequence of InputState, one per tick
+            loop: Start over when the script runs out instead of idling
+        """
+        self.states = list(states)
+        self.loop = loop
+        self.index = 0
+
+    def poll(self, events=()):
+        if self.index >= len(self.states):
+            if not self.loop or not self.states:
+                return InputState()
+            self.index = 0
+        state = self.states[self.index]
+        self.index += 1
+        return state
+
+
+class RandomInput:
+    """Input source that mashes random controls, for automated runs."""
+
+    def __init__(self, rng=None, hold_ticks=(5, 30), shoot_chance=0.9):
+        """Create a random input source.
+
+        Args:
+            rng: random.Random to draw from (defaults to a fresh one)
+            hold_ticks: Range of ticks each random choice is held for
+            shoot_chance: Probability that fire is held during a choice
+        """
+        self.rng = rng or random.Random()
+        self.hold_ticks = hold_ticks
+        self.shoot_chance = shoot_chance
+        self.remaining = 0
+        self.state = InputState()
+
+    def poll(self, events=()):
+        if self.remaining <= 0:
+            rng = self.rng
+            turn = rng.choice((None, "left", "right"))
+            self.state = InputState(
+                rotate_left=turn == "left",
+                rotate_right=turn == "right",
+                thrust=rng.random() < 0.5,
+                reverse=rng.random() < 0.1,
+                shoot=rng.random() < self.shoot_chance,
+                perk_choice=rng.randrange(3),
+            )
+            self.remaining = rng.randint(*self.hold_ticks)
+        self.remaining -= 1
+        return self.state
@@ -0,0 +1,109 @@
+from src.constants import ASTEROID_MAX_RADIUS
+from src.utils.spatial_hash import SpatialHash
+from src.utils.topology import WORLD
+
+
+class NeighborIndex(SpatialHash):
+    """Spatial hash over long-lived shapes, kept up to date between ticks.
+
+    Unlike a SpatialHash rebuilt from scratch, refresh() only touches the
+    buckets of shapes that joined, left or crossed into another cell since
+    the last refresh. Queries return shapes in the order they joined, so
+    anything iterating the results stays deterministic.
+
+    Use query() for candidates and neighbors() for the shapes overlapping
+    a circle (a swarm leader's influence, a blast radius, an area perk).
+
+    Refreshed from an AsteroidStore, the index skips the buckets and sorts
+    the store's slots with rebuild_arrays(), so candidates() returns store
+    slots and a query costs what is near it rather than a pass over the
+    store. The slots, members, positions and radii are those of the last
+    refresh; sprites that joined since are not indexed and sprites that
+    left keep their old entries.
+    """
+
+    def __init__(self, cell_size=ASTEROID_MAX_RADIUS * 2, topology=WORLD):
+        super().__init__(cell_size, topology)
+        self.cell_of = {}
+        self.joined = 0
+        # Store state from the last refresh(), when one was given
+        self.members = None  # Store member in each slot
+        self.positions = None
+        self.radii = None
+
+    def clear(self):
+        super().clear()
+        self.cell_of.clear()
+        self.cell_starts = self.sorted_rows = self.members = None
+        self.positions = self.radii = None
+
+    def insert(self, shape):
+        """Add a shape that is not in the index yet."""
+        cell = self._cell(self._column(shape.position.x), self._row(shape.position.y))
+        self._enter(shape, cell)
+        if shape.radius > self.max_radius:
+            self.max_radius = shape.radius
+
+    def remove(self, shape):
+        """Drop a shape from the index; unknown shapes are ignored."""
+        cell = self.cell_of.pop(shape, None)
+        if cell is not None:
+            self._leave(shape, cell)
+            del self.order[shape]
+
+    def refresh(self, shapes, store=None):
+        """Bring the index in line with shapes' current positions.
+
+        Args:
+            shapes: Every shape that should be indexed, usually a group.
+                Indexed shapes missing from it are removed.
+            store: Optional AsteroidStore holding the same shapes; the
+                store's slots are then sorted by cell in one array pass and
+                the buckets are left empty
+        """
+        if store is not None:
+            self._refresh_store(store)
+            return
+
+        previous = self.cell_of
+        current = {}
+        for shape in shapes:
+            position = shape.position
+            cell = self._cell(self._column(position.x), self._row(position.y))
+            if shape.radius > self.max_radius:
+                self.max_radius = shape.radius
+            old_cell = previous.pop(shape, None)
+            if old_cell is None:
+                self.order[shape] = self.joined
+                self.joined += 1
+                self.cells.setdefault(cell, {})[shape] = None
+            elif old_cell != cell:
+                self._leave(shape, old_cell)
+                self.cells.setdefault(cell, {})[shape] = None
+            current[shape] = cell
+
+        # Whatever was not seen this time has left
+        for shape, cell in previous.items():
+            self._leave(shape, cell)
+            del self.order[shape]
+        self.cell_of = current
+
+    def _refresh_store(self, store):
+        count = store.count
+        # Kills within the tick move slots around; keep what the slots held
+        self.members = store.slots.copy()
+        self.positions = store.positions[:count].copy()
+        self.radii = store.radii[:count].copy()
+        self.rebuild_arrays(self.positions, self.radii)
+
+    def _enter(self, shape, cell):
+        self.cells.setdefault(cell, {})[shape] = None
+        self.cell_of[shape] = cell
+        self.order[shape] = self.joined
+        self.joined += 1
+
+    def _leave(self, shape, cell):
+        bucket = self.cells[cell]
+        del bucket[shape]
+        if not bucket:
+            del self.cells[cell]
@@ -0,0 +1,139 @@
+import json
+import math
+import time
+
+from src.constants import PROFILER_SAMPLES
+
+
+class RingBuffer:
+    """Fixed-size buffer of the most recent float samples."""
+
+    def __init__(self, capacity=PROFILER_SAMPLES):
+        self.samples = [0.0] * capacity
+        self.capacity = capacity
+        self.index = 0
+        self.count = 0
+
+    def add(self, value):
+        self.samples[self.index] = value
+        self.index = (self.index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def values(self):
+        """Return the buffered samples, oldest first."""
+        if self.count < self.capacity:
+            return self.samples[:self.count]
+        return self.samples[self.index:] + self.samples[:self.index]
+
+    def stats(self):
+        """Return min, avg, p95, p99 and max of the buffered samples."""
+        values = sorted(self.samples[:self.count])
+        if not values:
+            return {"count": 0, "min": 0.0, "avg": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        return {
+            "count": len(values),
+            "min": values[0],
+            "avg": sum(values) / len(values),
+            "p95": _percentile(values, 95),
+            "p99": _percentile(values, 99),
+            "max": values[-1],
+        }
+
+
+class _Scope:
+    """Reusable context manager timing one named scope."""
+
+    __slots__ = ("samples", "start")
+
+    def __init__(self, samples):
+        self.samples = samples
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.samples.add(time.perf_counter() - self.start)
+
+
+class _NullScope:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class Profiler:
+    """Named timing scopes with a ring buffer of recent samples per scope.
+
+    Wrap hot paths in ``with profiler.scope("name"):``; each exit records
+    one sample. A disabled profiler hands out a shared no-op scope, so
+    instrumented code costs next to nothing when nobody is looking.
+    """
+
+    def __init__(self, capacity=PROFILER_SAMPLES, enabled=True):
+        """Create a profiler.
+
+        Args:
+            capacity: Samples kept per scope
+            enabled: Record samples; toggle later through the attribute
+        """
+        self.capacity = capacity
+        self.enabled = enabled
+        self.buffers = {}
+        self.scopes = {}
+
+    def scope(self, name):
+        """Return a context manager that times its block under name."""
+        if not self.enabled:
+            return _NULL_SCOPE
+        scope = self.scopes.get(name)
+        if scope is None:
+            scope = self.scopes[name] = _Scope(self.buffer(name))
+        return scope
+
+    def record(self, name, seconds):
+        """Add a sample measured elsewhere, such as a sum over several calls."""
+        if self.enabled:
+            self.buffer(name).add(seconds)
+
+    def buffer(self, name):
+        """Return the ring buffer for a scope, creating it on first use."""
+        buffer = self.buffers.get(name)
+        if buffer is None:
+            buffer = self.buffers[name] = RingBuffer(self.capacity)
+        return buffer
+
+    def stats(self):
+        """Return per-scope statistics in milliseconds."""
+        result = {}
+        for name, buffer in self.buffers.items():
+            stats = buffer.stats()
+            result[name] = {key: value * 1000 if key != "count" else value
+                            for key, value in stats.items()}
+        return result
+
+    def dump(self, path):
+        """Write per-scope statistics and the raw samples (ms) as JSON."""
+        document = {
+            "capacity": self.capacity,
+            "scopes": self.stats(),
+            "samples": {name: [value * 1000 for value in buffer.values()]
+                        for name, buffer in self.buffers.items()},
+        }
+        with open(path, "w") as f:
+            json.dump(document, f, indent=2)
+            f.write("\n")
+
+
+def _percentile(sorted_values, percent):
+    # Nearest-rank percentile of an already sorted list
+    rank = math.ceil(percent / 100 * len(sorted_values)) - 1
+    return sorted_values[max(0, rank)]
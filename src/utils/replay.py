@@ -0,0 +1,174 @@
+"""Compact, streamable recordings of a game's per-tick input.
+
+A replay file is a fixed header followed by run-length encoded input
+records:
+
+    header:  magic b"BKRP", format version (u8), padding (3 bytes),
+             game seed (u64), seconds per tick (f64)
+    records: input bitmask (u16), number of consecutive ticks (u16)
+
+Records are only ever appended, and both the writer and the reader work
+one record at a time, so long sessions never sit in memory.
+"""
+import struct
+
+from src.utils.input_source import ABILITY_KEYS, InputState
+
+REPLAY_MAGIC = b"BKRP"
+REPLAY_VERSION = 1
+
+HEADER = struct.Struct("<4sB3xQd")
+RECORD = struct.Struct("<HH")
+MAX_RUN = 0xFFFF
+
+# Bit layout of the per-tick input mask
+ROTATE_LEFT_BIT = 1 << 0
+ROTATE_RIGHT_BIT = 1 << 1
+THRUST_BIT = 1 << 2
+REVERSE_BIT = 1 << 3
+SHOOT_BIT = 1 << 4
+ABILITY_SHIFT = 5  # Five bits, one per ability key
+PERK_SHIFT = ABILITY_SHIFT + len(ABILITY_KEYS)  # Perk choice + 1, 0 for none
+PERK_MASK = 0b111
+
+
+def encode_input(state):
+    """Pack an InputState into a 16-bit mask."""
+    mask = 0
+    if state.rotate_left:
+        mask |= ROTATE_LEFT_BIT
+    if state.rotate_right:
+        mask |= ROTATE_RIGHT_BIT
+    if state.thrust:
+        mask |= THRUST_BIT
+    if state.reverse:
+        mask |= REVERSE_BIT
+    if state.shoot:
+        mask |= SHOOT_BIT
+    for i, pressed in enumerate(state.abilities):
+        if pressed:
+            mask |= 1 << (ABILITY_SHIFT + i)
+    if state.perk_choice is not None:
+        mask |= (min(state.perk_choice + 1, PERK_MASK)) << PERK_SHIFT
+    return mask
+
+
+def decode_input(mask):
+    """Unpack a 16-bit mask into an InputState."""
+    perk_bits = (mask >> PERK_SHIFT) & PERK_MASK
+    return InputState(
+        rotate_left=bool(mask & ROTATE_LEFT_BIT),
+        rotate_right=bool(mask & ROTATE_RIGHT_BIT),
+        thrust=bool(mask & THRUST_BIT),
+        reverse=bool(mask & REVERSE_BIT),
+        shoot=bool(mask & SHOOT_BIT),
+        abilities=[bool(mask & (1 << (ABILITY_SHIFT + i))) for i in range(len(ABILITY_KEYS))],
+        perk_choice=perk_bits - 1 if perk_bits else None,
+    )
+
+
+class ReplayWriter:
+    """Appends one game's per-tick input to a replay file."""
+
+    def __init__(self, path, seed, dt):
+        """Create the file and write its header.
+
+        Args:
+            path: Output file path
+            seed: The recorded game's seed
+            dt: Seconds per simulation tick
+        """
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, seed, dt))
+        self.mask = None
+        self.run = 0
+        self.ticks = 0
+
+    def record(self, state):
+        """Log the input used for one tick."""
+        mask = encode_input(state)
+        if mask == self.mask and self.run < MAX_RUN:
+            self.run += 1
+        else:
+            self._write_run()
+            self.mask = mask
+            self.run = 1
+        self.ticks += 1
+
+    def flush(self):
+        """Write the pending run and push everything to disk."""
+        self._write_run()
+        self.mask = None
+        self.run = 0
+        self.file.flush()
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _write_run(self):
+        if self.run:
+            self.file.write(RECORD.pack(self.mask, self.run))
+
+
+class ReplayInput:
+    """Input source that plays a replay file back one tick at a time."""
+
+    def __init__(self, path):
+        """Open a replay and read its header.
+
+        Args:
+            path: Replay file written by ReplayWriter
+
+        Raises:
+            ValueError: If the file is not a replay this version can read
+        """
+        self.file = open(path, "rb")
+        header = self.file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            self.file.close()
+            raise ValueError(f"{path} is too short to be a replay")
+        magic, version, self.seed, self.dt = HEADER.unpack(header)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            self.file.close()
+            raise ValueError(f"{path} is not a version {REPLAY_VERSION} replay")
+
+        self.finished = False
+        self.remaining = 0
+        self.state = InputState()
+        self.states = {}
+
+    def has_next(self):
+        """Return True while there are recorded ticks left to play."""
+        while self.remaining == 0 and not self.finished:
+            self._read_run()
+        return not self.finished
+
+    def poll(self, events=()):
+        if not self.has_next():
+            return InputState()
+        self.remaining -= 1
+        return self.state
+
+    def close(self):
+        self.file.close()
+
+    def _read_run(self):
+        record = self.file.read(RECORD.size)
+        if len(record) < RECORD.size:
+            self.finished = True
+            self.file.close()
+            return
+        mask, self.remaining = RECORD.unpack(record)
+        # Reuse one InputState per distinct mask
+        state = self.states.get(mask)
+        if state is None:
+            state = self.states[mask] = decode_input(mask)
+        self.state = state
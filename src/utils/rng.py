@@ -0,0 +1,57 @@
+import hashlib
+import random
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only generator() needs it
+    np = None
+
+
+class GameRNG:
+    """Per-game random source split into independent named sub-streams.
+
+    Each subsystem draws from its own random.Random seeded from the game
+    seed and the stream name, so one subsystem drawing more or fewer
+    numbers never shifts another's sequence, and the same seed gives the
+    same game in any process. Batched array code draws from NumPy
+    Generators created the same way by generator().
+    """
+
+    # Sub-streams used by the game
+    SPAWNS = "spawns"
+    ASTEROIDS = "asteroids"
+    ELITES = "elites"
+    ELITE_BEHAVIOURS = "elite_behaviours"
+    PERKS = "perks"
+    INPUT = "input"
+
+    def __init__(self, seed=None):
+        """Create the RNG context.
+
+        Args:
+            seed: Integer game seed; a random one is picked when None
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        self.streams = {}
+        self.generators = {}
+
+    def stream(self, name):
+        """Return the random.Random for a named sub-stream."""
+        rng = self.streams.get(name)
+        if rng is None:
+            rng = self.streams[name] = random.Random(self._stream_seed(name))
+        return rng
+
+    def generator(self, name):
+        """Return the numpy.random.Generator for a named sub-stream."""
+        rng = self.generators.get(name)
+        if rng is None:
+            rng = self.generators[name] = np.random.default_rng(self._stream_seed(name))
+        return rng
+
+    def _stream_seed(self, name):
+        # hashlib rather than hash(), which is salted per process for strings
+        digest = hashlib.sha256(f"{self.seed}/{name}".encode()).digest()
+        return int.from_bytes(digest[:8], "big")
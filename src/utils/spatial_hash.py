@@ -0,0 +1,183 @@
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the array methods need it
+    np = None
+
+from src.constants import ASTEROID_MAX_RADIUS
+from src.utils.topology import WORLD
+
+
+class SpatialHash:
+    """Uniform grid broadphase for circle shapes on the wrapping screen.
+
+    Shapes are bucketed by the cell that holds their centre. The grid
+    covers exactly one screen and cell indices wrap modulo the grid size,
+    the same way Asteroid.update wraps positions, so shapes near one edge
+    are found by queries near the opposite edge. query() only returns
+    candidates; neighbors() adds the exact wrapped circle test.
+
+    Circles held in arrays skip the buckets: rebuild_arrays() sorts their
+    rows by cell, keeping each cell's run in cell_starts, and candidates()
+    answers a whole batch of circle queries by joining the runs of the
+    cells each one covers.
+    """
+
+    def __init__(self, cell_size=ASTEROID_MAX_RADIUS * 2, topology=WORLD):
+        """Create an empty grid.
+
+        Args:
+            cell_size: Nominal cell edge length in pixels. It is stretched
+                slightly so a whole number of cells spans the world.
+            topology: WorldTopology the grid covers
+        """
+        self.topology = topology
+        self.columns = max(1, int(topology.width // cell_size))
+        self.rows = max(1, int(topology.height // cell_size))
+        self.cell_width = topology.width / self.columns
+        self.cell_height = topology.height / self.rows
+        self.cells = {}
+        self.order = {}
+        self.max_radius = 0
+        # Array layout from rebuild_arrays()
+        self.cell_starts = None  # Offset of each cell's run in sorted_rows, plus the end
+        self.sorted_rows = None  # Array rows ordered by cell
+
+    def clear(self):
+        """Remove every shape from the grid."""
+        self.cells.clear()
+        self.order.clear()
+        self.max_radius = 0
+
+    def insert(self, shape):
+        """Add a shape to the cell containing its centre."""
+        cell = self._cell(self._column(shape.position.x), self._row(shape.position.y))
+        self.cells.setdefault(cell, []).append(shape)
+        self.order[shape] = len(self.order)
+        if shape.radius > self.max_radius:
+            self.max_radius = shape.radius
+
+    def rebuild(self, shapes):
+        """Clear the grid and insert shapes, remembering their order.
+
+        Args:
+            shapes: Iterable of shapes, usually a sprite group. Query results
+                come back in this iteration order.
+        """
+        self.clear()
+        for shape in shapes:
+            self.insert(shape)
+
+    def rebuild_arrays(self, positions, radii):
+        """Sort circles given as arrays into cells, for candidates().
+
+        Args:
+            positions: Array of shape (n, 2)
+            radii: Array of shape (n,)
+        """
+        columns = (positions[:, 0] // self.cell_width).astype(int) % self.columns
+        rows = (positions[:, 1] // self.cell_height).astype(int) % self.rows
+        cells = columns * self.rows + rows
+        self.sorted_rows = np.argsort(cells, kind="stable")
+        self.cell_starts = np.zeros(self.columns * self.rows + 1, dtype=int)
+        np.cumsum(np.bincount(cells, minlength=self.columns * self.rows), out=self.cell_starts[1:])
+        self.max_radius = float(radii.max()) if len(radii) else 0
+
+    def candidates(self, centers, radii):
+        """Return the array rows that might overlap each of a batch of circles.
+
+        Only valid after rebuild_arrays().
+
+        Args:
+            centers: Array of query circle centres, one row per query
+            radii: Array of query circle radii
+
+        Returns:
+            tuple: (queries, rows) arrays, one entry per candidate, where
+            queries[i] is the query rows[i] was found for. Queries come in
+            order; within one, rows come cell by cell.
+        """
+        centers = np.asarray(centers, dtype=float).reshape(-1, 2)
+        reach = np.asarray(radii, dtype=float) + self.max_radius
+        first_columns = np.floor((centers[:, 0] - reach) / self.cell_width).astype(int)
+        first_rows = np.floor((centers[:, 1] - reach) / self.cell_height).astype(int)
+        # A query wider than the grid covers every column (or row) once
+        columns = np.minimum(
+            np.floor((centers[:, 0] + reach) / self.cell_width).astype(int) - first_columns + 1, self.columns)
+        rows = np.minimum(
+            np.floor((centers[:, 1] + reach) / self.cell_height).astype(int) - first_rows + 1, self.rows)
+
+        # Every covered cell of every query
+        sizes = columns * rows
+        queries = np.repeat(np.arange(len(centers)), sizes)
+        within = np.arange(len(queries)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        span = rows[queries]
+        cells = ((first_columns[queries] + within // span) % self.columns * self.rows
+                 + (first_rows[queries] + within % span) % self.rows)
+
+        # Every row in the runs of those cells
+        starts = self.cell_starts[cells]
+        lengths = self.cell_starts[cells + 1] - starts
+        queries = np.repeat(queries, lengths)
+        offsets = np.arange(len(queries)) + np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        return queries, self.sorted_rows[offsets]
+
+    def query(self, position, radius):
+        """Return shapes that might overlap a circle.
+
+        Args:
+            position: Centre of the query circle
+            radius: Radius of the query circle
+
+        Returns:
+            list: Candidate shapes in insertion order
+        """
+        cells = self._cells_near(position, radius)
+        candidates = []
+        for cell in cells:
+            bucket = self.cells.get(cell)
+            if bucket:
+                candidates.extend(bucket)
+
+        if len(cells) > 1:
+            candidates.sort(key=self.order.__getitem__)
+        return candidates
+
+    def neighbors(self, position, radius):
+        """Return shapes overlapping a circle, by minimal-image distance.
+
+        Args:
+            position: Centre of the query circle
+            radius: Radius of the query circle
+
+        Returns:
+            list: Overlapping shapes in insertion order
+        """
+        overlaps = self.topology.overlaps
+        return [shape for shape in self.query(position, radius)
+                if overlaps(position, radius, shape.position, shape.radius)]
+
+    def _cells_near(self, position, radius):
+        reach = radius + self.max_radius
+        first_column = self._column(position[0] - reach)
+        last_column = self._column(position[0] + reach)
+        first_row = self._row(position[1] - reach)
+        last_row = self._row(position[1] + reach)
+
+        # Collect the wrapped cells first so a query wider than the grid
+        # does not visit (and return) the same cell twice
+        return {
+            self._cell(column, row)
+            for column in range(first_column, last_column + 1)
+            for row in range(first_row, last_row + 1)
+        }
+
+    def _column(self, x):
+        return math.floor(x / self.cell_width)
+
+    def _row(self, y):
+        return math.floor(y / self.cell_height)
+
+    def _cell(self, column, row):
+        return column % self.columns, row % self.rows
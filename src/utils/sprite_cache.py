@@ -0,0 +1,73 @@
+import math
+from collections import OrderedDict
+
+import pygame
+
+from src.constants import SPRITE_CACHE_SIZE, SPRITE_PULSE_STEPS
+
+# Sprites use a black color key; nothing drawn into them is pure black
+SPRITE_COLORKEY = (0, 0, 0)
+
+
+def pulse_step(time, frequency, steps=SPRITE_PULSE_STEPS):
+    """Quantize the phase of sin(time * frequency) to one of steps frames."""
+    return int((time * frequency / math.tau) % 1 * steps) % steps
+
+
+def pulse_angle(step, steps=SPRITE_PULSE_STEPS):
+    """Return the phase angle (radians) a pulse_step frame is drawn at."""
+    return step * math.tau / steps
+
+
+def blank_sprite(half_size):
+    """Return an empty square sprite surface and its center point.
+
+    Args:
+        half_size: Distance from the center to the farthest drawn pixel
+    """
+    half = math.ceil(half_size) + 1
+    surface = pygame.Surface((half * 2, half * 2))
+    surface.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+    return surface, (half, half)
+
+
+class SpriteCache:
+    """Least-recently-used cache of pre-rasterized sprites.
+
+    Keys describe everything that changes a sprite's pixels (kind, radius,
+    quantized animation frame), so drawing a cached shape is one blit.
+    """
+
+    def __init__(self, capacity=SPRITE_CACHE_SIZE):
+        self.capacity = capacity
+        self.sprites = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, render):
+        """Return the sprite for key, calling render(key) to build it on a miss."""
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = self.sprites[key] = render(key)
+        if len(self.sprites) > self.capacity:
+            self.sprites.popitem(last=False)
+            self.evictions += 1
+        return sprite
+
+    def clear(self):
+        self.sprites.clear()
+
+    def stats(self):
+        """Return the cache's size and hit, miss and eviction counts."""
+        return {
+            "size": len(self.sprites),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
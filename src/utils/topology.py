@@ -0,0 +1,66 @@
+import math
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the array helpers need it
+    np = None
+
+from src.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+
+
+class WorldTopology:
+    """The wrap-around play field: a torus the size of the screen.
+
+    Everything that moves wraps modulo the screen, so the distance between
+    two points is the minimal-image distance: the shortest of the direct
+    path and the paths across each seam. Distance, overlap and direction
+    checks go through here so shapes on opposite edges interact.
+    """
+
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        self.width = width
+        self.height = height
+        self.half_width = width / 2
+        self.half_height = height / 2
+
+    def wrap(self, position):
+        """Wrap a Vector2 onto the screen in place."""
+        position.x %= self.width
+        position.y %= self.height
+
+    def delta(self, origin, target):
+        """Return the shortest Vector2 from origin to target."""
+        return pygame.Vector2(
+            (target[0] - origin[0] + self.half_width) % self.width - self.half_width,
+            (target[1] - origin[1] + self.half_height) % self.height - self.half_height,
+        )
+
+    def distance_squared(self, a, b):
+        dx = (b[0] - a[0] + self.half_width) % self.width - self.half_width
+        dy = (b[1] - a[1] + self.half_height) % self.height - self.half_height
+        return dx * dx + dy * dy
+
+    def distance(self, a, b):
+        return math.sqrt(self.distance_squared(a, b))
+
+    def overlaps(self, a, a_radius, b, b_radius):
+        """Return True if two circles overlap (strictly) across any seam."""
+        reach = a_radius + b_radius
+        return self.distance_squared(a, b) < reach * reach
+
+    def angle(self, origin, target):
+        """Return the direction from origin to target in degrees (0-360)."""
+        direction = self.delta(origin, target)
+        return math.degrees(math.atan2(direction.y, direction.x)) % 360
+
+    def wrap_deltas(self, deltas):
+        """Turn an array of raw (..., 2) position differences into minimal images, in place."""
+        deltas[..., 0] -= self.width * np.round(deltas[..., 0] / self.width)
+        deltas[..., 1] -= self.height * np.round(deltas[..., 1] / self.height)
+        return deltas
+
+
+# The screen-sized world the game plays in
+WORLD = WorldTopology()
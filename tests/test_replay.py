@@ -0,0 +1,68 @@
+import pytest
+
+from src.utils.input_source import InputState
+from src.utils.replay import (
+    HEADER,
+    MAX_RUN,
+    RECORD,
+    ReplayInput,
+    ReplayWriter,
+    decode_input,
+    encode_input,
+)
+
+
+def _read_masks(path):
+    replay = ReplayInput(path)
+    masks = []
+    while replay.has_next():
+        masks.append(encode_input(replay.poll()))
+    replay.close()
+    return replay, masks
+
+
+def test_encode_decode_round_trip():
+    state = InputState(rotate_left=True, thrust=True, shoot=True,
+                       abilities=[False, True, False, False, True], perk_choice=2)
+    decoded = decode_input(encode_input(state))
+    assert decoded.rotate_left and decoded.thrust and decoded.shoot
+    assert not (decoded.rotate_right or decoded.reverse)
+    assert decoded.abilities == (False, True, False, False, True)
+    assert decoded.perk_choice == 2
+    assert decode_input(encode_input(InputState())).perk_choice is None
+
+
+def test_writer_reader_round_trip(tmp_path):
+    path = tmp_path / "game.bkr"
+    states = ([InputState(thrust=True)] * 5 + [InputState(shoot=True, perk_choice=0)]
+              + [InputState()] * 3 + [InputState(thrust=True)] * 2)
+    with ReplayWriter(path, seed=1234, dt=1 / 120) as writer:
+        for state in states:
+            writer.record(state)
+
+    # One record per run of equal input
+    assert path.stat().st_size == HEADER.size + 4 * RECORD.size
+    replay, masks = _read_masks(path)
+    assert replay.seed == 1234
+    assert replay.dt == 1 / 120
+    assert masks == [encode_input(state) for state in states]
+
+
+def test_long_run_splits_at_the_run_limit(tmp_path):
+    path = tmp_path / "idle.bkr"
+    ticks = MAX_RUN * 2 + 7
+    with ReplayWriter(path, seed=1, dt=1 / 120) as writer:
+        for _ in range(ticks):
+            writer.record(InputState(shoot=True))
+        assert writer.ticks == ticks
+
+    assert path.stat().st_size == HEADER.size + 3 * RECORD.size
+    _, masks = _read_masks(path)
+    assert masks == [encode_input(InputState(shoot=True))] * ticks
+
+
+def test_rejects_files_that_are_not_replays(tmp_path):
+    path = tmp_path / "junk.bkr"
+    path.write_bytes(b"not a replay at all, honestly")
+    with pytest.raises(ValueError):
+        ReplayInput(path)
@@ -0,0 +1,72 @@
+import random
+
+import pygame
+import pytest
+
+from src.entities.asteroid import Asteroid
+from src.entities.elite_asteroid import EliteAsteroid
+from src.managers.asteroid_field import SpawnPlan
+
+
+@pytest.fixture
+def asteroid_group():
+    # Collect created asteroids without a running game
+    group = pygame.sprite.Group()
+    previous = Asteroid.__dict__.get("containers")
+    Asteroid.containers = (group,)
+    yield group
+    if previous is None:
+        del Asteroid.containers
+    else:
+        Asteroid.containers = previous
+
+
+def _planned(seed, count=40):
+    plan = SpawnPlan()
+    plan.plan(random.Random(seed), count, speed_bonus=5, elite_chance=0.3)
+    return plan
+
+
+def _columns(plan):
+    return [list(column) for column in (plan.edges, plan.offsets, plan.speeds,
+                                        plan.angles, plan.kinds, plan.elite_types)]
+
+
+def _describe(asteroid):
+    return (type(asteroid).__name__, asteroid.radius, tuple(asteroid.position),
+            tuple(asteroid.velocity))
+
+
+def test_plan_is_deterministic_for_a_seed():
+    assert _columns(_planned(7)) == _columns(_planned(7))
+    assert _columns(_planned(7)) != _columns(_planned(8))
+
+
+def test_plan_appends_one_entry_per_asteroid():
+    plan = _planned(7, count=25)
+    assert len(plan) == plan.remaining == 25
+    assert all(len(column) == 25 for column in _columns(plan))
+    assert any(elite >= 0 for elite in plan.elite_types)
+
+
+def test_release_is_deterministic_and_in_plan_order(asteroid_group):
+    first = _planned(3)
+    assert first.release() == 40
+    created = [_describe(asteroid) for asteroid in asteroid_group]
+    asteroid_group.empty()
+
+    # The same plan released in small batches gives the same asteroids
+    second = _planned(3)
+    while second.remaining:
+        assert second.release(7) <= 7
+    assert [_describe(asteroid) for asteroid in asteroid_group] == created
+    assert any(isinstance(asteroid, EliteAsteroid) for asteroid in asteroid_group)
+
+
+def test_release_clears_the_plan_when_done(asteroid_group):
+    plan = _planned(3, count=10)
+    assert plan.release(4) == 4
+    assert plan.remaining == 6 and len(plan) == 10
+    assert plan.release() == 6
+    assert len(plan) == plan.remaining == 0
+    assert plan.release() == 0